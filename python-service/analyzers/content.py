@@ -1,15 +1,47 @@
 """
 Content Analyzer — Hook detection, CTA detection, keyword extraction
 """
+import os
 import re
+import threading
 from typing import TYPE_CHECKING
 import logging
 
+from analyzers.keywords import extract_keywords, KEYWORD_DIVERSITY, KEYWORD_BACKEND
+from analyzers.statistical_keywords import extract_keywords_statistical
+from services.embedding_cache import EmbeddingCache
+from services.embedding_batcher import EmbeddingBatcher
+
 if TYPE_CHECKING:
     from keybert import KeyBERT
 
 logger = logging.getLogger(__name__)
 
+KEYWORD_MODEL = "all-MiniLM-L6-v2"
+KEYWORD_MODEL_PRECISIONS = ("float32", "int8")
+# int8: dynamically quantized Linear layers — roughly half the model's memory, faster on CPU
+KEYWORD_MODEL_PRECISION = os.getenv("KEYWORD_MODEL_PRECISION", "float32")
+
+if KEYWORD_MODEL_PRECISION not in KEYWORD_MODEL_PRECISIONS:
+    raise ValueError(
+        f"KEYWORD_MODEL_PRECISION must be one of {KEYWORD_MODEL_PRECISIONS}, got {KEYWORD_MODEL_PRECISION!r}"
+    )
+
+
+def load_keyword_model(precision: str = KEYWORD_MODEL_PRECISION):
+    """The SentenceTransformer behind KeyBERT, optionally quantized for CPU inference."""
+    from sentence_transformers import SentenceTransformer
+
+    model = SentenceTransformer(KEYWORD_MODEL, device="cpu")
+    if precision == "int8":
+        import torch
+        from torch.ao.quantization import quantize_dynamic
+
+        # Weights stored as int8; activations are quantized on the fly per batch.
+        # The token embedding table stays float32 (it's a lookup, not a matmul).
+        quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+    return model
+
 # Hook patterns and their types
 HOOK_PATTERNS = {
     "question": [
@@ -32,22 +64,135 @@ HOOK_PATTERNS = {
     ],
 }
 
-CTA_PATTERNS = [
-    r"\b(follow|subscribe|like|comment|share|save|tag|dm|click the link|link in bio|swipe up|check out)\b",
-    r"\b(let me know|drop a|leave a|hit the|turn on|turn off|hit follow)\b",
+# Literal CTA phrases, matched as whole words anywhere in the text
+CTA_PHRASES = [
+    "follow", "subscribe", "like", "comment", "share", "save", "tag", "dm",
+    "click the link", "link in bio", "swipe up", "check out",
+    "let me know", "drop a", "leave a", "hit the", "turn on", "turn off", "hit follow",
 ]
 
+# Each power word found anywhere in the hook adds a small boost
+POWER_WORDS = (
+    "secret", "proven", "never", "always", "guaranteed", "instantly",
+    "surprising", "shocking", "bizarre", "incredible", "life-changing",
+    "mistake", "warning", "finally", "exposed", "banned",
+)
+
+# Hooks opening with these are penalized
+WEAK_STARTERS = ("hi ", "hey ", "hello ", "welcome", "today i", "in this video", "in today's")
+
+SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+def _phrase_pattern(phrases: list[str]) -> str:
+    """
+    Build a prefix-trie alternation from literal phrases, e.g.
+    ["turn on", "turn off"] → "turn o(?:ff|n)" (escaped). re tries a plain alternation
+    branch by branch at every position; the trie rejects most positions on the
+    first character.
+    """
+    trie: dict = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if "" in node:
+            body = f"(?:{body})?"
+        return body
+
+    return build(trie)
+
+
+class RuleEngine:
+    """
+    Hook and CTA rule sets, compiled once at import.
+    Hook types keep their HOOK_PATTERNS priority: start-anchored patterns are
+    merged into one alternation (the first named group to match wins), and the
+    few unanchored ones (e.g. a trailing "?") are checked separately.
+    Power words and weak starters are plain substring/prefix tests — for
+    hook-length text C string search beats any single-pass regex.
+    """
+
+    def __init__(
+        self,
+        hook_patterns: dict[str, list[str]],
+        power_words: tuple[str, ...],
+        weak_starters: tuple[str, ...],
+        cta_phrases: list[str],
+    ):
+        self._priority = {hook_type: i for i, hook_type in enumerate(hook_patterns)}
+        self._group_types: dict[str, str] = {}
+        anchored: list[str] = []
+        self._unanchored: list[tuple[str, re.Pattern]] = []
+        for hook_type, patterns in hook_patterns.items():
+            for i, pattern in enumerate(patterns):
+                if pattern.startswith("^"):
+                    group = f"{hook_type}_{i}"
+                    self._group_types[group] = hook_type
+                    anchored.append(f"(?P<{group}>{pattern})")
+                else:
+                    self._unanchored.append((hook_type, re.compile(pattern, re.IGNORECASE)))
+        self._hook_re = re.compile("|".join(anchored), re.IGNORECASE)
+
+        self._power_words = power_words
+        self._weak_starters = weak_starters
+        self._cta_re = re.compile(rf"\b{_phrase_pattern(cta_phrases)}\b", re.IGNORECASE)
+
+    def hook_type(self, hook_lower: str) -> str:
+        """Highest-priority hook type matching the text, or "none"."""
+        detected = "none"
+        match = self._hook_re.match(hook_lower)
+        if match:
+            detected = self._group_types[match.lastgroup]
+        for hook_type, pattern in self._unanchored:
+            if detected != "none" and self._priority[hook_type] >= self._priority[detected]:
+                continue
+            if pattern.search(hook_lower):
+                detected = hook_type
+        return detected
+
+    def has_cta(self, text_lower: str) -> bool:
+        return self._cta_re.search(text_lower) is not None
+
+    def scan_hook(self, hook_lower: str) -> dict:
+        """Hook type, power-word hits and weak-starter hit for a lowercased hook."""
+        return {
+            "hook_type": self.hook_type(hook_lower),
+            "power_words": [w for w in self._power_words if w in hook_lower],
+            "weak_starter": hook_lower.startswith(self._weak_starters),
+        }
+
+
+RULES = RuleEngine(HOOK_PATTERNS, POWER_WORDS, WEAK_STARTERS, CTA_PHRASES)
+
+
 class ContentAnalyzer:
     def __init__(self):
         self._kw_model: "KeyBERT | None" = None
+        # Posts are analyzed on worker threads — only one may load the model
+        self._kw_model_lock = threading.Lock()
+        # Every embedding goes through the cache; misses from all threads are
+        # batched into shared forward passes on the batcher's thread
+        # int8 vectors differ slightly from float32 ones, so each precision has its own cache
+        cache_model = KEYWORD_MODEL if KEYWORD_MODEL_PRECISION == "float32" else f"{KEYWORD_MODEL}-{KEYWORD_MODEL_PRECISION}"
+        self.embedding_cache = EmbeddingCache(cache_model)
+        self.embedding_batcher = EmbeddingBatcher(lambda texts: self.kw_model.model.embed(texts))
 
     @property
     def kw_model(self) -> "KeyBERT":
         if self._kw_model is None:
-            logger.info("Loading KeyBERT model...")
-            from keybert import KeyBERT
-            from sentence_transformers import SentenceTransformer
-            self._kw_model = KeyBERT(model=SentenceTransformer("all-MiniLM-L6-v2"))
+            with self._kw_model_lock:
+                if self._kw_model is None:
+                    logger.info(f"Loading KeyBERT model ({KEYWORD_MODEL_PRECISION})...")
+                    from keybert import KeyBERT
+                    self._kw_model = KeyBERT(model=load_keyword_model())
         return self._kw_model
 
     def analyze_hook(self, text: str) -> dict:
@@ -59,37 +204,21 @@ class ContentAnalyzer:
             return {"score": 0.0, "hook_text": "", "hook_type": "none", "feedback": "No content to analyze"}
 
         # Take first sentence or first 150 chars
-        sentences = re.split(r'(?<=[.!?])\s+', text.strip())
+        sentences = SENTENCE_SPLIT_RE.split(text.strip())
         hook_text = sentences[0][:200] if sentences else text[:200]
         hook_lower = hook_text.lower().strip()
 
-        detected_type = "none"
-        base_score = 0.2  # default: no real hook
-
-        for hook_type, patterns in HOOK_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, hook_lower, re.IGNORECASE):
-                    detected_type = hook_type
-                    base_score = self._score_by_type(hook_type)
-                    break
-            if detected_type != "none":
-                break
+        rules = RULES.scan_hook(hook_lower)
+        detected_type = rules["hook_type"]
+        # default: no real hook
+        base_score = 0.2 if detected_type == "none" else self._score_by_type(detected_type)
 
         # Boost for power words
-        power_words = [
-            "secret", "proven", "never", "always", "guaranteed", "instantly",
-            "surprising", "shocking", "bizarre", "incredible", "life-changing",
-            "mistake", "warning", "finally", "exposed", "banned",
-        ]
-        power_word_count = sum(1 for w in power_words if w in hook_lower)
-        score = min(1.0, base_score + power_word_count * 0.05)
+        score = min(1.0, base_score + len(rules["power_words"]) * 0.05)
 
         # Penalize for weak starters
-        weak_starters = ["hi ", "hey ", "hello ", "welcome", "today i", "in this video", "in today's"]
-        for weak in weak_starters:
-            if hook_lower.startswith(weak):
-                score = max(0.1, score - 0.2)
-                break
+        if rules["weak_starter"]:
+            score = max(0.1, score - 0.2)
 
         return {
             "score": round(score, 3),
@@ -122,29 +251,65 @@ class ContentAnalyzer:
         """Detect if content contains a call-to-action."""
         if not text:
             return False
-        text_lower = text.lower()
-        for pattern in CTA_PATTERNS:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                return True
-        return False
-
-    def extract_keywords(self, text: str, top_n: int = 10) -> list[str]:
-        """Extract top keywords using KeyBERT (semantic keyword extraction)."""
-        if not text or len(text) < 20:
-            return []
+        return RULES.has_cta(text.lower())
+
+    def extract_keywords(
+        self, text: str, top_n: int = 10, diversity: str | None = None, backend: str | None = None,
+    ) -> list[str]:
+        """Extract top keywords (KeyBERT-style semantic extraction, or statistical — see backend)."""
+        return self.extract_keywords_batch([text], top_n=top_n, diversity=diversity, backend=backend)[0]
+
+    def extract_keywords_batch(
+        self, texts: list[str], top_n: int = 10, diversity: str | None = None, backend: str | None = None,
+    ) -> list[list[str]]:
+        """
+        Extract keywords for many documents at once.
+        All documents and the shared candidate vocabulary are embedded in a
+        few batched forward passes instead of one pass per document; keywords
+        are then picked per document (diversity: see analyzers/keywords.py).
+        backend="statistical" (or KEYWORD_BACKEND) skips the model entirely.
+        Returns one keyword list per input text, in input order.
+        """
+        backend = backend or KEYWORD_BACKEND
+        if backend == "embedding" and KEYWORD_BACKEND == "statistical":
+            raise ValueError("The embedding keyword backend is disabled (KEYWORD_BACKEND=statistical)")
+        results: list[list[str]] = [[] for _ in texts]
+        indices = [i for i, text in enumerate(texts) if text and len(text) >= 20]
+        if not indices:
+            return results
         try:
-            keywords = self.kw_model.extract_keywords(
-                text,
-                keyphrase_ngram_range=(1, 2),
-                stop_words="english",
-                use_maxsum=True,
-                nr_candidates=20,
-                top_n=top_n,
-            )
-            return [kw[0] for kw in keywords]
+            if backend == "statistical":
+                keywords = extract_keywords_statistical([texts[i] for i in indices], top_n=top_n)
+            else:
+                keywords = extract_keywords(
+                    [texts[i] for i in indices],
+                    self._embed,
+                    top_n=top_n,
+                    nr_candidates=20,
+                    diversity=diversity or KEYWORD_DIVERSITY,
+                )
+            for i, doc_keywords in zip(indices, keywords):
+                results[i] = doc_keywords
         except Exception as e:
             logger.warning(f"Keyword extraction failed: {e}")
-            return []
+        return results
+
+    def _embed(self, texts: list[str]):
+        # KeyBERT's backend wrapper around the SentenceTransformer, behind the cache and batcher
+        return self.embedding_cache.embed(texts, self.embedding_batcher.embed)
+
+    def embedding_stats(self) -> dict:
+        return {"cache": self.embedding_cache.stats(), "batcher": self.embedding_batcher.stats()}
+
+    def close(self):
+        self.embedding_batcher.close()
+        self.embedding_cache.close()
+
+    def warm_up(self, text: str) -> None:
+        """Load the keyword model and run one extraction. Raises if the model can't load."""
+        if KEYWORD_BACKEND == "embedding":
+            _ = self.kw_model
+        self.extract_keywords_batch([text])
 
     def extract_visual_categories(self, labels: list[str]) -> list[str]:
         """Map raw image labels to high-level content categories."""
@@ -0,0 +1,159 @@
+"""
+Keyword Selection — KeyBERT-style candidate scoring with selectable diversification
+Candidates are each document's 1-2 word n-grams (English stop words removed),
+scored by cosine similarity to the document embedding. The final top_n are
+picked by one of:
+  mmr    — Maximal Marginal Relevance (default): greedy relevance minus
+           redundancy over all candidates, as KeyBERT's use_mmr
+  maxsum — KeyBERT's Max Sum Distance (the extractor's original behaviour)
+           over the nr_candidates most relevant; exhaustive:
+           C(20, 10) = 184,756 subsets per document, ~200x slower than mmr
+  greedy — relevance order, skipping candidates too similar to one already kept
+  none   — plain top_n by relevance
+The default is gated on scripts/benchmark_keywords.py --check, which fails
+unless it reproduces KeyBERT's own selections for that mode.
+Why not KeyBERT.extract_keywords (which has use_mmr/use_maxsum)? It embeds
+through its own backend, whereas here embedding is left to the caller (`embed`):
+that is where the embedding cache, the cross-request batcher and the int8 model
+plug in, and every mode shares one batched pass. maxsum and mmr reproduce
+KeyBERT's selections (the benchmark reports the overlap with both).
+KEYWORD_BACKEND=statistical replaces all of this with analyzers/statistical_keywords.py
+and keeps the embedding model (and torch) out of the process entirely.
+"""
+import os
+import itertools
+from typing import Callable
+
+import numpy as np
+
+KEYWORD_BACKENDS = ("embedding", "statistical")
+# statistical also refuses per-request "embedding", so the deployment never loads torch
+KEYWORD_BACKEND = os.getenv("KEYWORD_BACKEND", "embedding")
+DIVERSITY_MODES = ("mmr", "greedy", "none", "maxsum")
+KEYWORD_DIVERSITY = os.getenv("KEYWORD_DIVERSITY", "mmr")
+KEYWORD_MMR_DIVERSITY = float(os.getenv("KEYWORD_MMR_DIVERSITY", "0.5"))  # 0 = pure relevance
+KEYWORD_GREEDY_MAX_SIMILARITY = float(os.getenv("KEYWORD_GREEDY_MAX_SIMILARITY", "0.8"))
+
+if KEYWORD_BACKEND not in KEYWORD_BACKENDS:
+    raise ValueError(f"KEYWORD_BACKEND must be one of {KEYWORD_BACKENDS}, got {KEYWORD_BACKEND!r}")
+if KEYWORD_DIVERSITY not in DIVERSITY_MODES:
+    raise ValueError(f"KEYWORD_DIVERSITY must be one of {DIVERSITY_MODES}, got {KEYWORD_DIVERSITY!r}")
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def select_keywords(
+    doc_embedding: np.ndarray,
+    candidate_embeddings: np.ndarray,
+    candidates: list[str],
+    top_n: int,
+    nr_candidates: int = 20,
+    diversity: str = KEYWORD_DIVERSITY,
+) -> list[str]:
+    """Pick top_n of one document's candidates. Embeddings must be L2-normalized."""
+    if not candidates:
+        return []
+    relevance = candidate_embeddings @ doc_embedding
+    # Most relevant first. KeyBERT's MMR considers every candidate, the rest the top nr_candidates
+    pool = np.argsort(-relevance, kind="stable")
+    if diversity != "mmr":
+        pool = pool[:max(nr_candidates, top_n)]
+
+    if diversity == "none":
+        chosen = pool[:top_n]
+    elif diversity == "maxsum":
+        chosen = _max_sum(candidate_embeddings, pool, top_n)
+    else:
+        similarity = candidate_embeddings[pool] @ candidate_embeddings[pool].T
+        if diversity == "mmr":
+            picked = _mmr(relevance[pool], similarity, top_n, KEYWORD_MMR_DIVERSITY)
+        else:
+            picked = _greedy(similarity, top_n, KEYWORD_GREEDY_MAX_SIMILARITY)
+        chosen = pool[picked]
+    # Report in relevance order whatever the selection order was
+    chosen = sorted(chosen, key=lambda i: -relevance[i])
+    return [candidates[i] for i in chosen]
+
+
+def _mmr(relevance: np.ndarray, similarity: np.ndarray, top_n: int, diversity: float) -> list[int]:
+    """Indices into the pool (relevance-sorted, so index 0 is always picked first)."""
+    picked = [0]
+    # Highest similarity of each pool entry to anything picked so far
+    redundancy = similarity[0].copy()
+    available = np.ones(len(relevance), dtype=bool)
+    available[0] = False
+    for _ in range(min(top_n, len(relevance)) - 1):
+        scores = (1 - diversity) * relevance - diversity * redundancy
+        scores[~available] = -np.inf
+        best = int(np.argmax(scores))
+        picked.append(best)
+        available[best] = False
+        np.maximum(redundancy, similarity[best], out=redundancy)
+    return picked
+
+
+def _greedy(similarity: np.ndarray, top_n: int, max_similarity: float) -> list[int]:
+    """Relevance order, skipping near-duplicates; tops up with the skipped ones if short."""
+    picked = [0]
+    for i in range(1, len(similarity)):
+        if len(picked) >= top_n:
+            return picked[:top_n]
+        if similarity[i, picked].max() < max_similarity:
+            picked.append(i)
+    skipped = [i for i in range(len(similarity)) if i not in picked]
+    return picked + skipped[:top_n - len(picked)]
+
+
+def _max_sum(candidate_embeddings: np.ndarray, pool: np.ndarray, top_n: int) -> list[int]:
+    """KeyBERT's Max Sum Distance, including its quirk of returning nothing for short documents."""
+    if top_n > len(candidate_embeddings):
+        return []
+    similarity = candidate_embeddings[pool] @ candidate_embeddings[pool].T
+    best, best_sum = None, np.inf
+    for combination in itertools.combinations(range(len(pool)), top_n):
+        index = np.array(combination)
+        total = similarity[np.ix_(index, index)].sum() - len(index)  # minus the diagonal
+        if total < best_sum:
+            best, best_sum = combination, total
+    return [pool[i] for i in best]
+
+
+def extract_keywords(
+    texts: list[str],
+    embed: Callable[[list[str]], np.ndarray],
+    top_n: int = 10,
+    nr_candidates: int = 20,
+    diversity: str = KEYWORD_DIVERSITY,
+) -> list[list[str]]:
+    """
+    Keywords for each text. Documents and the union of their candidates are
+    embedded in two embed() calls. Returns one list per text, in input order.
+    """
+    from sklearn.feature_extraction.text import CountVectorizer
+
+    if diversity not in DIVERSITY_MODES:
+        raise ValueError(f"Unknown keyword diversity mode: {diversity}")
+    try:
+        count = CountVectorizer(ngram_range=(1, 2), stop_words="english").fit(texts)
+    except ValueError:
+        # Nothing but stop words
+        return [[] for _ in texts]
+    words = count.get_feature_names_out()
+    presence = count.transform(texts)
+
+    doc_embeddings = _normalize(np.asarray(embed(texts), dtype=np.float32))
+    word_embeddings = _normalize(np.asarray(embed(list(words)), dtype=np.float32))
+
+    results = []
+    for i in range(len(texts)):
+        candidate_indices = presence[i].nonzero()[1]
+        results.append(select_keywords(
+            doc_embeddings[i],
+            word_embeddings[candidate_indices],
+            [words[j] for j in candidate_indices],
+            top_n, nr_candidates, diversity,
+        ))
+    return results
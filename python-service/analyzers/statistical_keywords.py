@@ -0,0 +1,109 @@
+"""
+Statistical Keywords — torch-free keyword extraction (YAKE-style word features)
+Scores each word from statistics of the text itself: how often it occurs,
+how early it first appears, and how often it's capitalized mid-sentence
+or used as a hashtag. An IDF term is added when several documents are
+extracted together. Candidates are single words and adjacent word pairs.
+A pair never spans punctuation (",;:—()\"" etc.), and neither word may be a
+stop word. A phrase scores by its words. A word already covered by a picked
+phrase is skipped.
+Pure Python: used by KEYWORD_BACKEND=statistical so workers never import
+keybert/sentence-transformers/torch.
+"""
+import re
+import math
+from collections import Counter
+
+_SENTENCE_RE = re.compile(r"[.!?\n]+")
+# Words (with inner apostrophes/hyphens, optional leading #) or single punctuation marks
+_TOKEN_RE = re.compile(r"#?\w[\w'’-]*\w|#?\w|[^\w\s]")
+_PHRASE_BOOST = 1.2  # a pair of good words reads better than either alone
+
+STOP_WORDS = frozenset("""
+a about above after again against all almost also am an and any are aren't as at be because been before
+being below between both but by can can't cannot could couldn't did didn't do does doesn't doing don't
+done down during each either else even ever every few for from further get gets getting got had hadn't
+has hasn't have haven't having he he'd he'll he's her here here's hers herself him himself his how how's
+i i'd i'll i'm i've if im in into is isn't it it's its itself just least less let's like made make many
+may me might more most much must mustn't my myself never no nor not now of off often on once one only
+or other ought our ours ourselves out over own per quite rather really same say says shall shan't she
+she'd she'll she's should shouldn't since so some still such than that that's the their theirs them
+themselves then there there's these they they'd they'll they're they've thing things this those though
+through thus to too under until up upon us very via want was wasn't way we we'd we'll we're we've well
+were weren't what what's when when's where where's whether which while who who's whom whose why why's
+will with within without won't would wouldn't yet you you'd you'll you're you've your yours yourself
+yourselves dont im ive youre thats cant wont didnt doesnt isnt arent wasnt
+""".split())
+
+
+def _sentences(text: str) -> list[list[str]]:
+    sentences = (_TOKEN_RE.findall(part) for part in _SENTENCE_RE.split(text))
+    return [tokens for tokens in sentences if tokens]
+
+
+def _is_word(token: str) -> bool:
+    return token[-1].isalnum() or token[-1] == "_"
+
+
+def _is_candidate(word: str) -> bool:
+    return len(word) >= 3 and word not in STOP_WORDS and not word.isdigit()
+
+
+def _word_stats(sentences: list[list[str]]) -> dict[str, list]:
+    """word → [count, first sentence index, emphasized count]"""
+    stats: dict[str, list] = {}
+    for s, tokens in enumerate(sentences):
+        for t, token in enumerate(tokens):
+            word = token.lstrip("#").lower().replace("’", "'")
+            if not _is_candidate(word):
+                continue
+            entry = stats.setdefault(word, [0, s, 0])
+            entry[0] += 1
+            # Hashtags, and capitals anywhere but the start of a sentence or clause
+            if token.startswith("#") or (t > 0 and token[0].isupper() and _is_word(tokens[t - 1])):
+                entry[2] += 1
+    return stats
+
+
+def _document_keywords(sentences: list[list[str]], idf: dict[str, float], top_n: int) -> list[str]:
+    stats = _word_stats(sentences)
+    word_score = {
+        word: (1 + math.log(count))
+        * (1 + emphasized / count)
+        / math.log2(2 + first_sentence)
+        * idf.get(word, 1.0)
+        for word, (count, first_sentence, emphasized) in stats.items()
+    }
+
+    scores: dict[str, float] = dict(word_score)
+    pairs: Counter[tuple[str, str]] = Counter()
+    for tokens in sentences:
+        words = [token.lstrip("#").lower().replace("’", "'") for token in tokens]
+        # Punctuation tokens never score, so pairs stop at them
+        for a, b in zip(words, words[1:]):
+            if a in word_score and b in word_score and a != b:
+                pairs[(a, b)] += 1
+    for (a, b), count in pairs.items():
+        scores[f"{a} {b}"] = (word_score[a] + word_score[b]) / 2 * (1 + math.log(count)) * _PHRASE_BOOST
+
+    # Dicts keep insertion order (first occurrence), so sorted() breaks ties by position
+    keywords, covered = [], set()
+    for phrase in sorted(scores, key=lambda p: -scores[p]):
+        words = set(phrase.split())
+        if words <= covered:
+            continue
+        keywords.append(phrase)
+        covered |= words
+        if len(keywords) >= top_n:
+            break
+    return keywords
+
+
+def extract_keywords_statistical(texts: list[str], top_n: int = 10) -> list[list[str]]:
+    """Keywords for each text, in input order. Documents in one call share IDF weights."""
+    documents = [_sentences(text) for text in texts]
+    idf: dict[str, float] = {}
+    if len(documents) > 1:
+        df = Counter(word for sentences in documents for word in _word_stats(sentences))
+        idf = {word: math.log((1 + len(documents)) / (1 + n)) + 1 for word, n in df.items()}
+    return [_document_keywords(sentences, idf, top_n) for sentences in documents]
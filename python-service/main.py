@@ -4,6 +4,8 @@ FastAPI service for compute-heavy tasks: transcription, NLP, scraping
 """
 import sys
 import os
+import time
+import asyncio
 import logging
 print(f"[startup] Python {sys.version}, PID {os.getpid()}", flush=True)
 
@@ -13,12 +15,16 @@ load_dotenv()
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Depends, Header
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse, JSONResponse
 import structlog
 
 from models.analysis import (
-    PostAnalysisRequest, PostAnalysisResponse,
+    PostInput, PostAnalysisRequest, PostAnalysisResponse,
+    SinglePostAnalysis, PostAnalysisSummary,
     ProfileScrapeRequest, ProfileScrapeResponse,
+    BatchProfileScrapeRequest, BatchProfileScrapeResponse, ProfileScrapeResult,
     CompetitorAnalysisRequest, CompetitorAnalysisResponse,
+    JobCreatedResponse, JobStatusResponse,
 )
 
 # ─── Logging ──────────────────────────────────────────────────────────────────
@@ -37,15 +43,38 @@ content_analyzer = None
 sentiment_analyzer = None
 hashtag_analyzer = None
 scraper = None
+analyzer_executors = None
+job_manager = None
 _services_ready = False
+_services_lock = asyncio.Lock()
+
+# Opt-in: load services and models in the background right after startup
+WARMUP_ON_STARTUP = os.getenv("WARMUP_ON_STARTUP", "false").lower() == "true"
+_SERVICE_MODULES = [
+    "services.transcription", "analyzers.content", "analyzers.sentiment",
+    "analyzers.hashtags", "scrapers.public_scraper", "services.executors", "services.jobs",
+]
+# component → {"ready": bool, "seconds": load time, "error": str | None}
+_readiness: dict[str, dict] = {
+    name: {"ready": False, "seconds": None, "error": None}
+    for name in ("services", "keyword_model", "sentiment_model")
+}
 
 
 async def _ensure_services():
     """Initialize services on first real request (not healthcheck).
     Imports are deferred here to avoid slow module loads blocking startup."""
-    global transcription_service, content_analyzer, sentiment_analyzer, hashtag_analyzer, scraper, _services_ready
     if _services_ready:
         return
+    async with _services_lock:
+        if not _services_ready:
+            started = time.perf_counter()
+            await _init_services()
+            _readiness["services"].update(ready=True, seconds=round(time.perf_counter() - started, 2))
+
+
+async def _init_services():
+    global transcription_service, content_analyzer, sentiment_analyzer, hashtag_analyzer, scraper, analyzer_executors, job_manager, _services_ready
     logger.info("Initializing services on first request...")
 
     from services.transcription import TranscriptionService
@@ -53,24 +82,71 @@ async def _ensure_services():
     from analyzers.sentiment import SentimentAnalyzer
     from analyzers.hashtags import HashtagAnalyzer
     from scrapers.public_scraper import PublicProfileScraper
+    from services.executors import AnalyzerExecutors
+    from services.jobs import JobManager
 
     transcription_service = TranscriptionService()
     content_analyzer = ContentAnalyzer()
     sentiment_analyzer = SentimentAnalyzer()
     hashtag_analyzer = HashtagAnalyzer()
+    analyzer_executors = AnalyzerExecutors([content_analyzer, sentiment_analyzer, hashtag_analyzer])
+    job_manager = JobManager()
     scraper = PublicProfileScraper()
     await scraper.init()
     _services_ready = True
     logger.info("All services initialized")
 
 
+async def _warm_up():
+    """
+    Background warm-up (WARMUP_ON_STARTUP=true): import service modules off
+    the event loop, initialize services, then run a dummy inference through
+    each model so the first real request doesn't pay for loading them.
+    """
+    import importlib
+
+    try:
+        for module in _SERVICE_MODULES:
+            await asyncio.to_thread(importlib.import_module, module)
+        await _ensure_services()
+    except Exception as e:
+        _readiness["services"]["error"] = str(e)
+        logger.error("warmup_failed", component="services", error=str(e))
+        return
+
+    dummy = "How I grew my channel to ten thousand followers in one month"
+    for component, pool, method, arg in (
+        ("sentiment_model", "sentiment", "analyze", dummy),
+        ("keyword_model", "keywords", "warm_up", dummy),
+    ):
+        started = time.perf_counter()
+        try:
+            await analyzer_executors.run(pool, method, arg)
+            _readiness[component].update(ready=True, seconds=round(time.perf_counter() - started, 2))
+        except Exception as e:
+            _readiness[component]["error"] = str(e)
+            logger.error("warmup_failed", component=component, error=str(e))
+    logger.info("warmup_complete", **{k: v["seconds"] for k, v in _readiness.items()})
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("SocialOptimizer Python service starting...")
+    warmup_task = asyncio.create_task(_warm_up()) if WARMUP_ON_STARTUP else None
     yield
-    # Cleanup scraper on shutdown if it was initialized
+    if warmup_task:
+        warmup_task.cancel()
+    # Cleanup jobs, scraper and analyzer pools on shutdown if they were initialized
+    if job_manager:
+        await job_manager.close()
     if scraper:
         await scraper.close()
+    if analyzer_executors:
+        analyzer_executors.shutdown()
+    if content_analyzer:
+        content_analyzer.close()
+    if transcription_service:
+        transcription_service.close()
     logger.info("Service shutdown complete")
 
 
@@ -97,6 +173,13 @@ def verify_secret(x_service_secret: str = Header(...)):
         raise HTTPException(status_code=403, detail="Forbidden")
     return True
 
+# ─── Concurrency limits ───────────────────────────────────────────────────────
+# Posts in a batch are processed concurrently. Transcription (yt-dlp + Whisper)
+# is network-bound and gets its own limit; CPU analysis is bounded by the
+# analyzer pool sizes (see services/executors.py).
+TRANSCRIPTION_CONCURRENCY = int(os.getenv("TRANSCRIPTION_CONCURRENCY", "4"))
+_transcription_slots = asyncio.Semaphore(TRANSCRIPTION_CONCURRENCY)
+
 # ─── Routes ───────────────────────────────────────────────────────────────────
 
 @app.get("/health")
@@ -104,9 +187,40 @@ async def health():
     return {"status": "ok", "service": "social-optimizer-python", "ready": _services_ready}
 
 
+@app.get("/ready")
+async def ready():
+    """
+    Readiness for the orchestrator. With WARMUP_ON_STARTUP this is 503 until
+    every component has loaded; without it everything loads lazily on the
+    first request, so the service always reports ready.
+    """
+    is_ready = all(c["ready"] for c in _readiness.values()) or not WARMUP_ON_STARTUP
+    return JSONResponse(
+        status_code=200 if is_ready else 503,
+        content={"ready": is_ready, "warmup": WARMUP_ON_STARTUP, "components": _readiness},
+    )
+
+
+@app.get("/stats")
+async def stats(_: bool = Depends(verify_secret)):
+    """Internal counters for capacity tuning."""
+    return {
+        "ready": _services_ready,
+        "scraper": dict(scraper.stats) if scraper else None,
+        "browser_pool": dict(scraper.browser_pool.stats) if scraper and scraper.browser_pool else None,
+        "hosts": scraper.limiter.snapshot() if scraper else None,
+        # From the keywords pool (its worker's own cache and batcher in process mode)
+        "embeddings": (
+            await analyzer_executors.run("keywords", "embedding_stats") if analyzer_executors else None
+        ),
+    }
+
+
 @app.post("/analyze/posts", response_model=PostAnalysisResponse)
 async def analyze_posts(
     request: PostAnalysisRequest,
+    stream: bool = False,
+    accept: str = Header(""),
     _: bool = Depends(verify_secret)
 ):
     """
@@ -115,62 +229,151 @@ async def analyze_posts(
     - Detect hooks and CTAs
     - Run sentiment analysis
     - Extract keywords
+
+    keyword_backend picks semantic ("embedding") or torch-free ("statistical")
+    keywords for this request; omitted, the deployment's KEYWORD_BACKEND applies.
+
+    With ?stream=true or Accept: application/x-ndjson, each SinglePostAnalysis
+    is sent as an NDJSON line as soon as that post finishes (completion order),
+    followed by one PostAnalysisSummary line ({"type": "summary", ...}).
     """
     await _ensure_services()
+    _check_keyword_backend(request)
     logger.info("analyze_posts", count=len(request.posts))
 
-    hook_scores = []
-    sentiment_scores = []
-    cta_count = 0
-    post_analyses = []
+    if stream or "application/x-ndjson" in accept:
+        return StreamingResponse(_stream_post_analyses(request), media_type="application/x-ndjson")
 
-    for post in request.posts:
-        try:
-            # Step 1: Transcribe if video
-            transcript = ""
-            if post.media_url and request.platform in ("tiktok", "instagram", "youtube"):
-                try:
-                    transcript = await transcription_service.transcribe(post.media_url)
-                except Exception as e:
-                    logger.warning("transcription_failed", post_id=post.id, error=str(e))
-
-            text = f"{post.caption or ''} {transcript}".strip()
-
-            # Step 2: Analyze hook
-            hook_result = content_analyzer.analyze_hook(transcript or post.caption or "")
-            hook_scores.append(hook_result["score"])
-
-            # Step 3: Detect CTA
-            has_cta = content_analyzer.detect_cta(text)
-            if has_cta:
-                cta_count += 1
-
-            # Step 4: Sentiment
-            sent_score = sentiment_analyzer.analyze(text)
-            sentiment_scores.append(sent_score)
-
-            # Step 5: Keywords
-            keywords = content_analyzer.extract_keywords(text)
-
-            post_analyses.append({
-                "post_id": post.id,
-                "transcript": transcript,
-                "hook_score": hook_result["score"],
-                "hook_text": hook_result["hook_text"],
-                "hook_type": hook_result["hook_type"],
-                "cta_detected": has_cta,
-                "sentiment_score": sent_score,
-                "keywords": keywords,
-            })
-        except Exception as e:
-            logger.error("post_analysis_error", post_id=post.id, error=str(e))
+    # Posts run concurrently; gather() keeps results in input order and
+    # _analyze_post never raises, so one bad post can't hold up the rest.
+    results = await asyncio.gather(
+        *(_analyze_post(post, request.platform, request.keyword_backend) for post in request.posts)
+    )
+
+    analyzed = [
+        (post, result) for post, result in zip(request.posts, results) if result is not None
+    ]
 
+    # Step 5: Keywords — one batched KeyBERT pass for the whole request
+    texts = [_post_text(post, result["transcript"]) for post, result in analyzed]
+    keywords = await analyzer_executors.run(
+        "keywords", "extract_keywords_batch", texts, 10, None, request.keyword_backend
+    )
+    for (_, result), post_keywords in zip(analyzed, keywords):
+        result["keywords"] = post_keywords
+
+    return _posts_response(results)
+
+
+def _posts_response(results: list[dict | None]) -> PostAnalysisResponse:
+    """Aggregate per-post results (input order, None for failed posts)."""
+    analyses = [result for result in results if result is not None]
     return PostAnalysisResponse(
-        hook_scores=hook_scores,
-        sentiment_scores=sentiment_scores,
+        hook_scores=[result["hook_score"] for result in analyses],
+        sentiment_scores=[result["sentiment_score"] for result in analyses],
+        cta_count=sum(1 for result in analyses if result["cta_detected"]),
+        post_analyses=analyses,
+    )
+
+
+async def _iter_post_analyses(request: PostAnalysisRequest):
+    """
+    Yield (index, result) for each post as soon as it finishes, keywords
+    included. result is None for a failed post. Stopping early cancels the rest.
+    """
+    tasks = {
+        asyncio.ensure_future(
+            _analyze_post(post, request.platform, request.keyword_backend, with_keywords=True)
+        ): i
+        for i, post in enumerate(request.posts)
+    }
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield tasks[task], task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _stream_post_analyses(request: PostAnalysisRequest):
+    """NDJSON lines for a streamed /analyze/posts response."""
+    # Only the scores are kept for the trailer, in input order
+    scores: list[tuple[float, float] | None] = [None] * len(request.posts)
+    cta_count = 0
+    async for index, result in _iter_post_analyses(request):
+        if result is None:
+            continue
+        scores[index] = (result["hook_score"], result["sentiment_score"])
+        if result["cta_detected"]:
+            cta_count += 1
+        yield SinglePostAnalysis(**result).model_dump_json() + "\n"
+
+    summary = PostAnalysisSummary(
+        hook_scores=[s[0] for s in scores if s],
+        sentiment_scores=[s[1] for s in scores if s],
         cta_count=cta_count,
-        post_analyses=post_analyses,
+        failed_post_ids=[post.id for post, s in zip(request.posts, scores) if s is None],
     )
+    yield summary.model_dump_json() + "\n"
+
+
+async def _analyze_post(
+    post: PostInput, platform: str, keyword_backend: str | None = None, with_keywords: bool = False,
+) -> dict | None:
+    """
+    Transcribe and analyze a single post. Returns None if analysis fails.
+    Keywords are left empty for the caller to batch unless with_keywords is set.
+    """
+    try:
+        # Step 1: Transcribe if video
+        transcript = ""
+        if post.media_url and platform in ("tiktok", "instagram", "youtube"):
+            try:
+                async with _transcription_slots:
+                    transcript = await transcription_service.transcribe(post.media_url)
+            except Exception as e:
+                logger.warning("transcription_failed", post_id=post.id, error=str(e))
+
+        text = _post_text(post, transcript)
+
+        # Steps 2-5 are CPU-bound — run them on the analyzer pools
+        steps = [
+            analyzer_executors.run("content", "analyze_hook", transcript or post.caption or ""),
+            analyzer_executors.run("content", "detect_cta", text),
+            analyzer_executors.run("sentiment", "analyze", text),
+        ]
+        if with_keywords:
+            steps.append(analyzer_executors.run("keywords", "extract_keywords", text, 10, None, keyword_backend))
+        hook_result, has_cta, sent_score, *keywords = await asyncio.gather(*steps)
+
+        return {
+            "post_id": post.id,
+            "transcript": transcript,
+            "hook_score": hook_result["score"],
+            "hook_text": hook_result["hook_text"],
+            "hook_type": hook_result["hook_type"],
+            "cta_detected": has_cta,
+            "sentiment_score": sent_score,
+            "keywords": keywords[0] if keywords else [],
+        }
+    except Exception as e:
+        logger.error("post_analysis_error", post_id=post.id, error=str(e))
+        return None
+
+
+def _check_keyword_backend(request: PostAnalysisRequest):
+    from analyzers.keywords import KEYWORD_BACKEND
+
+    # A statistical-only deployment never loads the embedding model
+    if request.keyword_backend == "embedding" and KEYWORD_BACKEND == "statistical":
+        raise HTTPException(status_code=422, detail="keyword_backend 'embedding' is disabled on this deployment")
+
+
+def _post_text(post: PostInput, transcript: str) -> str:
+    return f"{post.caption or ''} {transcript}".strip()
 
 
 @app.post("/scrape/profile", response_model=ProfileScrapeResponse)
@@ -193,6 +396,51 @@ async def scrape_profile(
         raise HTTPException(status_code=422, detail=f"Could not scrape profile: {str(e)}")
 
 
+@app.post("/scrape/profiles", response_model=BatchProfileScrapeResponse)
+async def scrape_profiles(
+    request: BatchProfileScrapeRequest,
+    stream: bool = False,
+    accept: str = Header(""),
+    _: bool = Depends(verify_secret)
+):
+    """
+    Scrape several public profiles concurrently (paced per host by the scraper).
+    One profile failing doesn't fail the batch: its result carries an error.
+    With ?stream=true or Accept: application/x-ndjson, each ProfileScrapeResult
+    is sent as an NDJSON line as soon as it finishes (completion order).
+    """
+    await _ensure_services()
+    logger.info("scrape_profiles", count=len(request.profiles))
+
+    tasks = [
+        asyncio.ensure_future(_scrape_profile_result(i, item))
+        for i, item in enumerate(request.profiles)
+    ]
+    if stream or "application/x-ndjson" in accept:
+        return StreamingResponse(_stream_scrape_results(tasks), media_type="application/x-ndjson")
+    return BatchProfileScrapeResponse(results=await asyncio.gather(*tasks))
+
+
+async def _scrape_profile_result(index: int, item: ProfileScrapeRequest) -> ProfileScrapeResult:
+    result = ProfileScrapeResult(index=index, platform=item.platform, username=item.username)
+    try:
+        result.profile = ProfileScrapeResponse(**await scraper.get_profile(item.platform, item.username))
+    except Exception as e:
+        logger.warning("scrape_error", platform=item.platform, username=item.username, error=str(e))
+        result.error = f"Could not scrape profile: {e}"
+    return result
+
+
+async def _stream_scrape_results(tasks: list[asyncio.Future]):
+    """NDJSON lines for a streamed /scrape/profiles response. Disconnecting cancels the rest."""
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield (await next_done).model_dump_json() + "\n"
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
 @app.post("/analyze/competitor", response_model=CompetitorAnalysisResponse)
 async def analyze_competitor(
     request: CompetitorAnalysisRequest,
@@ -203,77 +451,145 @@ async def analyze_competitor(
     logger.info("analyze_competitor", username=request.competitor_username)
 
     try:
-        profile = await scraper.get_profile(request.platform, request.competitor_username)
-        recent_posts = await scraper.get_recent_posts(request.platform, request.competitor_username)
-
-        # Analyze competitor posts
-        comp_engagements = [p.get("engagement_rate", 0) for p in recent_posts]
-        comp_avg_eng = sum(comp_engagements) / len(comp_engagements) if comp_engagements else 0
-
-        comp_hashtags = []
-        for post in recent_posts:
-            comp_hashtags.extend(post.get("hashtags", []))
-        top_hashtags = list(set(comp_hashtags))[:20]
-
-        # Hook analysis on competitor content
-        hook_scores = []
-        for post in recent_posts[:10]:
-            hook = content_analyzer.analyze_hook(post.get("caption", ""))
-            hook_scores.append(hook["score"])
-        avg_hook = sum(hook_scores) / len(hook_scores) if hook_scores else 0
-
-        # Compute gaps
-        eng_gap = comp_avg_eng - request.user_engagement_rate
-        posting_gap = profile.get("posts_per_week", 0) - request.user_posts_per_week
-
-        # Hashtag differences
-        user_hashtag_set = set(request.user_hashtags)
-        comp_hashtag_set = set(top_hashtags)
-        hashtag_diff = [
-            {"hashtag": tag, "competitor_uses": True, "user_uses": False}
-            for tag in comp_hashtag_set - user_hashtag_set
-        ][:10]
-
-        # Generate tactical recommendations
-        tactical_actions = []
-        if eng_gap > 0.01:
-            tactical_actions.append({
-                "action": f"Study {request.competitor_username}'s top posts — their engagement is {eng_gap*100:.1f}% higher. Focus on their hook patterns.",
-                "priority": "high",
-                "rationale": "Closing the engagement gap is the highest-leverage action."
-            })
-        if posting_gap > 1:
-            tactical_actions.append({
-                "action": f"Increase posting frequency by {posting_gap:.1f} posts/week to match competitor cadence.",
-                "priority": "medium",
-                "rationale": "More content = more algorithm signals = faster growth."
-            })
-        if hashtag_diff:
-            top_missing = [h["hashtag"] for h in hashtag_diff[:5]]
-            tactical_actions.append({
-                "action": f"Test these hashtags from {request.competitor_username}'s strategy: {', '.join(top_missing)}",
-                "priority": "medium",
-                "rationale": "Competitor hashtags that you aren't using may unlock new audience segments."
-            })
-
-        return CompetitorAnalysisResponse(
-            competitor_username=request.competitor_username,
-            competitor_followers=profile.get("followers", 0),
-            competitor_avg_engagement=comp_avg_eng,
-            competitor_posts_per_week=profile.get("posts_per_week", 0),
-            competitor_top_hashtags=top_hashtags,
-            competitor_avg_hook_score=avg_hook,
-            engagement_gap=eng_gap,
-            posting_frequency_gap=posting_gap,
-            hashtag_differences=hashtag_diff,
-            tactical_actions=tactical_actions,
-        )
+        return await _compare_competitor(request)
     except Exception as e:
         logger.error("competitor_analysis_error", error=str(e))
         raise HTTPException(status_code=422, detail=str(e))
 
 
+async def _compare_competitor(request: CompetitorAnalysisRequest) -> CompetitorAnalysisResponse:
+    profile, recent_posts = await scraper.get_profile_and_posts(
+        request.platform, request.competitor_username
+    )
+
+    # Analyze competitor posts
+    comp_engagements = [p.get("engagement_rate", 0) for p in recent_posts]
+    comp_avg_eng = sum(comp_engagements) / len(comp_engagements) if comp_engagements else 0
+
+    comp_hashtags = []
+    for post in recent_posts:
+        comp_hashtags.extend(post.get("hashtags", []))
+    top_hashtags = list(set(comp_hashtags))[:20]
+
+    # Hook analysis on competitor content
+    hooks = await asyncio.gather(*(
+        analyzer_executors.run("content", "analyze_hook", post.get("caption", ""))
+        for post in recent_posts[:10]
+    ))
+    hook_scores = [hook["score"] for hook in hooks]
+    avg_hook = sum(hook_scores) / len(hook_scores) if hook_scores else 0
+
+    # Compute gaps
+    eng_gap = comp_avg_eng - request.user_engagement_rate
+    posting_gap = profile.get("posts_per_week", 0) - request.user_posts_per_week
+
+    # Hashtag differences
+    user_hashtag_set = set(request.user_hashtags)
+    comp_hashtag_set = set(top_hashtags)
+    hashtag_diff = [
+        {"hashtag": tag, "competitor_uses": True, "user_uses": False}
+        for tag in comp_hashtag_set - user_hashtag_set
+    ][:10]
+
+    # Generate tactical recommendations
+    tactical_actions = []
+    if eng_gap > 0.01:
+        tactical_actions.append({
+            "action": f"Study {request.competitor_username}'s top posts — their engagement is {eng_gap*100:.1f}% higher. Focus on their hook patterns.",
+            "priority": "high",
+            "rationale": "Closing the engagement gap is the highest-leverage action."
+        })
+    if posting_gap > 1:
+        tactical_actions.append({
+            "action": f"Increase posting frequency by {posting_gap:.1f} posts/week to match competitor cadence.",
+            "priority": "medium",
+            "rationale": "More content = more algorithm signals = faster growth."
+        })
+    if hashtag_diff:
+        top_missing = [h["hashtag"] for h in hashtag_diff[:5]]
+        tactical_actions.append({
+            "action": f"Test these hashtags from {request.competitor_username}'s strategy: {', '.join(top_missing)}",
+            "priority": "medium",
+            "rationale": "Competitor hashtags that you aren't using may unlock new audience segments."
+        })
+
+    return CompetitorAnalysisResponse(
+        competitor_username=request.competitor_username,
+        competitor_followers=profile.get("followers", 0),
+        competitor_avg_engagement=comp_avg_eng,
+        competitor_posts_per_week=profile.get("posts_per_week", 0),
+        competitor_top_hashtags=top_hashtags,
+        competitor_avg_hook_score=avg_hook,
+        engagement_gap=eng_gap,
+        posting_frequency_gap=posting_gap,
+        hashtag_differences=hashtag_diff,
+        tactical_actions=tactical_actions,
+    )
+
+
+# ─── Jobs ─────────────────────────────────────────────────────────────────────
+# Long analyses can run as background jobs: submit returns a job id at once,
+# a bounded worker pool runs the job, and GET /jobs/{id} reports progress.
+
+@app.post("/jobs/analyze-posts", response_model=JobCreatedResponse, status_code=202)
+async def submit_analyze_posts_job(
+    request: PostAnalysisRequest,
+    _: bool = Depends(verify_secret)
+):
+    """Queue an /analyze/posts run. Partial results are visible while it runs."""
+    await _ensure_services()
+    _check_keyword_backend(request)
+
+    async def run(job) -> dict:
+        results: list[dict | None] = [None] * len(request.posts)
+        async for index, result in _iter_post_analyses(request):
+            job.completed += 1
+            if result is not None:
+                results[index] = result
+                job.partial_results.append(result)
+        return _posts_response(results).model_dump()
+
+    return _submit_job("analyze-posts", len(request.posts), run)
+
+
+@app.post("/jobs/analyze-competitor", response_model=JobCreatedResponse, status_code=202)
+async def submit_analyze_competitor_job(
+    request: CompetitorAnalysisRequest,
+    _: bool = Depends(verify_secret)
+):
+    """Queue an /analyze/competitor run."""
+    await _ensure_services()
+
+    async def run(job) -> dict:
+        result = await _compare_competitor(request)
+        job.completed = 1
+        return result.model_dump()
+
+    return _submit_job("analyze-competitor", 1, run)
+
+
+@app.get("/jobs/{job_id}", response_model=JobStatusResponse)
+async def get_job(job_id: str, _: bool = Depends(verify_secret)):
+    job = job_manager.get(job_id) if job_manager else None
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    return job.to_dict()
+
+
+def _submit_job(kind: str, total: int, run) -> JobCreatedResponse:
+    from services.jobs import JobQueueFull
+
+    try:
+        job = job_manager.submit(kind, total, run)
+    except JobQueueFull as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    logger.info("job_submitted", job_id=job.id, kind=kind, total=total)
+    return JobCreatedResponse(job_id=job.id, status=job.status)
+
+
 if __name__ == "__main__":
+    # Prefer `python serve.py`: started this way, every spawned worker
+    # process re-imports this module (FastAPI, structlog, app setup)
     import uvicorn
     port = int(os.getenv("PORT", "8000"))
     uvicorn.run(
@@ -1,4 +1,5 @@
 """Pydantic models for Python service API requests/responses."""
+from datetime import datetime
 from pydantic import BaseModel, Field
 from typing import Optional, Literal
 
@@ -13,6 +14,8 @@ class PostInput(BaseModel):
 class PostAnalysisRequest(BaseModel):
     posts: list[PostInput]
     platform: str
+    # None = the deployment's KEYWORD_BACKEND
+    keyword_backend: Optional[Literal["embedding", "statistical"]] = None
 
 
 class SinglePostAnalysis(BaseModel):
@@ -33,6 +36,15 @@ class PostAnalysisResponse(BaseModel):
     post_analyses: list[SinglePostAnalysis]
 
 
+class PostAnalysisSummary(BaseModel):
+    """Trailer record of a streamed (NDJSON) /analyze/posts response."""
+    type: Literal["summary"] = "summary"
+    hook_scores: list[float]
+    sentiment_scores: list[float]
+    cta_count: int
+    failed_post_ids: list[str] = []
+
+
 class ProfileScrapeRequest(BaseModel):
     platform: Literal["tiktok", "instagram", "youtube", "facebook"]
     username: str
@@ -51,6 +63,23 @@ class ProfileScrapeResponse(BaseModel):
     content_formats: list[str] = []
 
 
+class BatchProfileScrapeRequest(BaseModel):
+    profiles: list[ProfileScrapeRequest] = Field(min_length=1, max_length=100)
+
+
+class ProfileScrapeResult(BaseModel):
+    """One item of a /scrape/profiles response; index is its position in the request."""
+    index: int
+    platform: str
+    username: str
+    profile: Optional[ProfileScrapeResponse] = None
+    error: Optional[str] = None
+
+
+class BatchProfileScrapeResponse(BaseModel):
+    results: list[ProfileScrapeResult]  # request order
+
+
 class CompetitorAnalysisRequest(BaseModel):
     platform: Literal["tiktok", "instagram", "youtube", "facebook"]
     competitor_username: str
@@ -82,3 +111,22 @@ class CompetitorAnalysisResponse(BaseModel):
     posting_frequency_gap: float
     hashtag_differences: list[HashtagDifference]
     tactical_actions: list[TacticalAction]
+
+
+class JobCreatedResponse(BaseModel):
+    job_id: str
+    status: Literal["queued", "running", "completed", "failed"]
+
+
+class JobStatusResponse(BaseModel):
+    job_id: str
+    kind: Literal["analyze-posts", "analyze-competitor"]
+    status: Literal["queued", "running", "completed", "failed"]
+    progress: float  # 0-1
+    completed_items: int
+    total_items: int
+    partial_results: list[SinglePostAnalysis] = []  # analyze-posts only, until completed
+    result: Optional[dict] = None  # PostAnalysisResponse | CompetitorAnalysisResponse
+    error: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
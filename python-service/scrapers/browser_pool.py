@@ -0,0 +1,142 @@
+"""
+Browser Pool — one persistent headless Chromium with reusable contexts
+The browser is launched on first use and kept until close(). Up to
+PLAYWRIGHT_POOL_SIZE contexts stay warm between renders; each is recycled
+after PLAYWRIGHT_CONTEXT_MAX_USES pages so cookies and cache don't pile up.
+Playwright is optional: without it installed, render() raises ImportError.
+"""
+import os
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
+logger = logging.getLogger(__name__)
+
+PLAYWRIGHT_POOL_SIZE = max(1, int(os.getenv("PLAYWRIGHT_POOL_SIZE", "2")))
+PLAYWRIGHT_CONTEXT_MAX_USES = max(1, int(os.getenv("PLAYWRIGHT_CONTEXT_MAX_USES", "20")))
+PLAYWRIGHT_NAV_TIMEOUT_MS = int(os.getenv("PLAYWRIGHT_NAV_TIMEOUT_MS", "15000"))
+PLAYWRIGHT_SELECTOR_TIMEOUT_MS = int(os.getenv("PLAYWRIGHT_SELECTOR_TIMEOUT_MS", "5000"))
+
+
+class _PooledContext:
+    __slots__ = ("context", "browser", "uses")
+
+    def __init__(self, context, browser):
+        self.context = context
+        self.browser = browser
+        self.uses = 0
+
+
+class BrowserPool:
+    """
+    Usage:
+        html, text = await pool.render(url, wait_for="a[href$='/followers/']")
+    At most `size` pages render at once; further callers wait for a context.
+    """
+
+    def __init__(
+        self,
+        size: int = PLAYWRIGHT_POOL_SIZE,
+        max_uses: int = PLAYWRIGHT_CONTEXT_MAX_USES,
+        context_options: dict | None = None,
+    ):
+        self.size = size
+        self.max_uses = max_uses
+        self.context_options = context_options or {}
+        self.stats = {"launches": 0, "contexts_created": 0, "contexts_recycled": 0, "renders": 0}
+        self._playwright = None
+        self._browser = None
+        self._idle: list[_PooledContext] = []
+        self._slots = asyncio.Semaphore(size)
+        self._launch_lock = asyncio.Lock()
+
+    async def _ensure_browser(self):
+        async with self._launch_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return self._browser
+            from playwright.async_api import async_playwright
+
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(headless=True)
+            self.stats["launches"] += 1
+            logger.info("Launched pooled Chromium")
+            return self._browser
+
+    @asynccontextmanager
+    async def context(self):
+        """Borrow a warm browser context (a fresh one if none is idle)."""
+        async with self._slots:
+            browser = await self._ensure_browser()
+            entry = None
+            while self._idle:
+                candidate = self._idle.pop()
+                if candidate.browser is browser:
+                    entry = candidate
+                    break
+                # Left over from a browser that crashed and was relaunched
+                await self._discard(candidate)
+            if entry is None:
+                entry = _PooledContext(await browser.new_context(**self.context_options), browser)
+                self.stats["contexts_created"] += 1
+
+            healthy = False
+            try:
+                yield entry.context
+                healthy = True
+            finally:
+                entry.uses += 1
+                if healthy and entry.uses < self.max_uses and browser.is_connected():
+                    self._idle.append(entry)
+                else:
+                    self.stats["contexts_recycled"] += 1
+                    await self._discard(entry)
+
+    async def render(
+        self,
+        url: str,
+        wait_for: str | None = None,
+        nav_timeout_ms: int = PLAYWRIGHT_NAV_TIMEOUT_MS,
+        selector_timeout_ms: int = PLAYWRIGHT_SELECTOR_TIMEOUT_MS,
+    ) -> tuple[str, str]:
+        """
+        Load url in a pooled context and return (html, body_text). With wait_for,
+        returns as soon as that selector appears; if it never does within
+        selector_timeout_ms, returns whatever has rendered by then.
+        """
+        async with self.context() as context:
+            page = await context.new_page()
+            try:
+                await page.goto(url, wait_until="domcontentloaded", timeout=nav_timeout_ms)
+                if wait_for:
+                    try:
+                        await page.wait_for_selector(wait_for, timeout=selector_timeout_ms)
+                    except Exception as e:
+                        # Timeout: login wall or layout change — still read what's there
+                        logger.debug(f"Selector {wait_for!r} not found on {url}: {e}")
+                self.stats["renders"] += 1
+                return await page.content(), await page.inner_text("body")
+            finally:
+                await page.close()
+
+    async def close(self):
+        for entry in self._idle:
+            await self._discard(entry)
+        self._idle = []
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception as e:
+                logger.debug(f"Browser close failed: {e}")
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    @staticmethod
+    async def _discard(entry: _PooledContext):
+        try:
+            await entry.context.close()
+        except Exception as e:
+            # Context already gone with its browser
+            logger.debug(f"Browser context close failed: {e}")
@@ -0,0 +1,167 @@
+"""
+Embedded JSON extractor — pull JSON blobs (ytInitialData, TikTok rehydration
+state, ...) out of large HTML pages without regex.
+Finds the marker with a plain substring search and decodes straight from
+that offset with JSONDecoder.raw_decode, which stops at the end of the
+object: no closing-tag regex, no backtracking, no copy of the blob's text.
+
+With `paths`, only the requested subtrees are decoded: everything else is
+skipped by a scanner that builds no Python objects, and the scan stops as
+soon as every path has been found.
+"""
+import re
+import json
+import logging
+from json.decoder import scanstring
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_decoder = json.JSONDecoder()
+
+_WS = re.compile(r"[ \t\n\r]*")
+# Everything up to the next bracket, strings consumed whole (so brackets inside
+# strings are ignored). Possessive quantifiers: no backtracking on odd input.
+_UNTIL_BRACKET = re.compile(r'(?:[^"{}\[\]]++|"(?:[^"\\]|\\.)*+")*+([{}\[\]])')
+_STRING_TAIL = re.compile(r'(?:[^"\\]|\\.)*+"')
+_PRIMITIVE = re.compile(r"[^,}\]\s]+")
+
+
+class _AllFound(Exception):
+    """Unwinds the scan once every requested path has been decoded."""
+
+
+def find_embedded_json(html: str, markers: tuple[str, ...], max_gap: int = 128) -> int:
+    """
+    Offset of the '{' opening the JSON that follows one of the markers, or -1.
+    Markers are tried in order; the brace must start within max_gap characters
+    of the marker's end (room for '= ' or the rest of a <script ...> tag).
+    """
+    for marker in markers:
+        pos = html.find(marker)
+        while pos != -1:
+            after = pos + len(marker)
+            brace = html.find("{", after, after + max_gap)
+            if brace != -1:
+                return brace
+            pos = html.find(marker, after)
+    return -1
+
+
+def extract_embedded_json(
+    html: str,
+    markers: tuple[str, ...],
+    paths: list[tuple[str, ...]] | None = None,
+    max_gap: int = 128,
+) -> Any | None:
+    """
+    Decode the JSON object that follows one of the markers, or None if absent/invalid.
+    With paths (key tuples, e.g. ("header",), ("contents", "tabs")), returns a
+    pruned document of the same shape holding only those subtrees; paths not
+    present in the blob are simply missing from the result. Overlapping paths
+    merge: a path inside another requested path is covered by it.
+    Raises ValueError for an empty path.
+    """
+    trie = _path_trie(paths) if paths is not None else None
+    start = find_embedded_json(html, markers, max_gap)
+    if start == -1:
+        return None
+    try:
+        if trie is None:
+            data, _ = _decoder.raw_decode(html, start)
+            return data
+        return _extract_paths(html, start, trie)
+    except (ValueError, IndexError, AttributeError) as e:
+        # JSONDecodeError is a ValueError; the scanner raises the others on truncated input
+        logger.debug(f"Embedded JSON after {markers[0]!r} invalid: {e}")
+        return None
+
+
+def _path_trie(paths: list[tuple[str, ...]]) -> dict:
+    """key → child trie, or None where a requested subtree ends. The shorter of two overlapping paths wins."""
+    trie: dict = {}
+    for path in paths:
+        if not path:
+            raise ValueError("Embedded JSON paths must have at least one key")
+        node = trie
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+            if node is None:
+                break  # already inside a requested subtree
+        else:
+            node[path[-1]] = None
+    return trie
+
+
+def _count_leaves(trie: dict) -> int:
+    return sum(1 if child is None else _count_leaves(child) for child in trie.values())
+
+
+def _extract_paths(s: str, start: int, trie: dict) -> dict:
+    out: dict = {}
+    remaining = [_count_leaves(trie)]
+    try:
+        _walk_object(s, start, trie, out, remaining)
+    except _AllFound:
+        pass
+    return out
+
+
+def _walk_object(s: str, pos: int, trie: dict, out: dict, remaining: list[int]) -> int:
+    """Scan the object at s[pos] ('{'); decode wanted keys into out. Returns end offset."""
+    pos = _WS.match(s, pos + 1).end()
+    if s[pos] == "}":
+        return pos + 1
+    while True:
+        if s[pos] != '"':
+            raise ValueError(f"Expected object key at {pos}")
+        key, pos = scanstring(s, pos + 1)
+        pos = _WS.match(s, pos).end()
+        if s[pos] != ":":
+            raise ValueError(f"Expected ':' at {pos}")
+        pos = _WS.match(s, pos + 1).end()
+
+        if key not in trie:
+            pos = _skip_value(s, pos)
+        elif trie[key] is None:
+            out[key], pos = _decoder.raw_decode(s, pos)
+            remaining[0] -= 1
+            if remaining[0] == 0:
+                raise _AllFound
+        elif s[pos] == "{":
+            pos = _walk_object(s, pos, trie[key], out.setdefault(key, {}), remaining)
+        else:
+            pos = _skip_value(s, pos)
+
+        pos = _WS.match(s, pos).end()
+        if s[pos] == ",":
+            pos = _WS.match(s, pos + 1).end()
+        elif s[pos] == "}":
+            return pos + 1
+        else:
+            raise ValueError(f"Expected ',' or '}}' at {pos}")
+
+
+def _skip_value(s: str, pos: int) -> int:
+    """End offset of the JSON value at s[pos], without building it."""
+    char = s[pos]
+    if char == '"':
+        return _STRING_TAIL.match(s, pos + 1).end()
+    if char not in "{[":
+        return _PRIMITIVE.match(s, pos).end()
+    depth = 0
+    while True:
+        match = _UNTIL_BRACKET.match(s, pos)
+        pos = match.end()
+        if match.group(1) in "{[":
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return pos
+
+
+# Markers for the blobs the scraper reads
+TIKTOK_UNIVERSAL_MARKERS = ('id="__UNIVERSAL_DATA_FOR_REHYDRATION__"',)
+TIKTOK_SIGI_MARKERS = ('id="SIGI_STATE"',)
+YOUTUBE_INITIAL_DATA_MARKERS = ("var ytInitialData", 'ytInitialData"')
@@ -0,0 +1,60 @@
+"""
+Head meta extractor — <title> and <meta> tags from a page's <head> in one pass
+Stops at </head> (or the first <body> tag), so the rest of the document is
+never tokenized and no DOM tree is built.
+"""
+import re
+from html.parser import HTMLParser
+
+_HEAD_END_RE = re.compile(r"</head\s*>|<body[\s>]", re.IGNORECASE)
+
+
+class HeadMetaParser(HTMLParser):
+    """
+    Incremental parser: feed() chunks until `done` is set.
+    Collects the first <title> text and each meta tag's content, keyed by
+    its name= or property= attribute (first occurrence wins).
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title: str | None = None
+        self.meta: dict[str, str] = {}
+        self.done = False
+        self._in_title = False
+        self._title_parts: list[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        if tag == "body":
+            self.done = True
+        elif tag == "title" and self.title is None:
+            self._in_title = True
+        elif tag == "meta":
+            attrs = dict(attrs)
+            key = attrs.get("name") or attrs.get("property")
+            if key and attrs.get("content") is not None:
+                self.meta.setdefault(key.lower(), attrs["content"])
+
+    def handle_endtag(self, tag):
+        if self.done:
+            return
+        if tag == "head":
+            self.done = True
+        elif tag == "title" and self._in_title:
+            self._in_title = False
+            self.title = "".join(self._title_parts)
+
+    def handle_data(self, data):
+        if self._in_title and not self.done:
+            self._title_parts.append(data)
+
+
+def extract_head_meta(html: str) -> HeadMetaParser:
+    """Parse only the <head> of a full HTML document."""
+    parser = HeadMetaParser()
+    end = _HEAD_END_RE.search(html)
+    parser.feed(html[:end.end()] if end else html)
+    parser.close()
+    return parser
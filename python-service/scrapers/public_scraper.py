@@ -3,14 +3,92 @@ Public Profile Scraper — httpx-based, public data only
 Scrapes only publicly visible data without authentication.
 Uses HTTP requests + HTML/JSON parsing instead of Playwright for reliability.
 """
-import json
+import os
+import asyncio
+import copy
 import logging
 import re
-from bs4 import BeautifulSoup
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+
 import httpx
+from tenacity import (
+    AsyncRetrying, RetryCallState, retry_if_exception_type, retry_if_result,
+    stop_after_attempt, wait_random_exponential,
+)
+
+from scrapers.embedded_json import (
+    extract_embedded_json,
+    TIKTOK_UNIVERSAL_MARKERS, TIKTOK_SIGI_MARKERS, YOUTUBE_INITIAL_DATA_MARKERS,
+)
+from scrapers.browser_pool import BrowserPool
+from scrapers.head_meta import extract_head_meta
+from scrapers.rate_limit import HostLimiter
+from scrapers.streaming_fetch import fetch_text, HeadMatcher, ScriptBlockMatcher, Matcher
 
 logger = logging.getLogger(__name__)
 
+# The only parts of each embedded blob we read — everything else is skipped
+# unparsed (see extract_embedded_json paths)
+_TIKTOK_USER_DETAIL = ("__DEFAULT_SCOPE__", "webapp.user-detail")
+_YOUTUBE_HEADER = ("header",)
+_YOUTUBE_TABS = ("contents", "twoColumnBrowseResultsRenderer", "tabs")
+
+# Rendered Instagram profile: the followers link, or the stats list item on layouts without one
+_INSTAGRAM_FOLLOWERS_SELECTOR = 'a[href$="/followers/"], header li:has-text("followers")'
+
+SCRAPER_MAX_ATTEMPTS = max(1, int(os.getenv("SCRAPER_MAX_ATTEMPTS", "3")))
+# A Retry-After longer than this is not worth holding the request for — give up instead
+SCRAPER_MAX_RETRY_AFTER = float(os.getenv("SCRAPER_MAX_RETRY_AFTER", "30"))
+
+_RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Statuses that mean "slow down" (shrink the host's concurrency limit)
+_THROTTLE_STATUSES = {429, 503}
+_backoff = wait_random_exponential(multiplier=0.5, max=8)
+
+
+def _retry_after(resp: httpx.Response) -> float | None:
+    """Seconds from a Retry-After header (delta-seconds or HTTP-date), or None."""
+    value = resp.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def _should_retry(result: tuple[httpx.Response, str, str]) -> bool:
+    resp = result[0]
+    if resp.status_code not in _RETRY_STATUSES:
+        return False
+    retry_after = _retry_after(resp)
+    return retry_after is None or retry_after <= SCRAPER_MAX_RETRY_AFTER
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    outcome = retry_state.outcome
+    if not outcome.failed:
+        retry_after = _retry_after(outcome.result()[0])
+        if retry_after is not None:
+            return retry_after
+    return _backoff(retry_state)
+
+
+def _relabel(result, scraped_as: str, username: str):
+    """Swap the scraped spelling of the username for the caller's in a profile or (profile, posts)."""
+    profile = result[0] if isinstance(result, tuple) else result
+    if isinstance(profile, dict):
+        for field in ("username", "platform_user_id"):
+            if profile.get(field) == scraped_as:
+                profile[field] = username
+    return result
+
+
 # Browser-like headers — keep minimal to avoid triggering bot detection.
 # Do NOT include Accept-Encoding: br (brotli) — httpx can't decompress it
 # and platforms may return garbled responses.
@@ -33,6 +111,15 @@ class PublicProfileScraper:
 
     def __init__(self):
         self.client: httpx.AsyncClient | None = None
+        self.browser_pool: BrowserPool | None = None
+        self.limiter = HostLimiter()
+        # Concurrent calls for the same (operation, platform, username) share one scrape
+        # key → (task, username as the first caller spelled it)
+        self._in_flight: dict[tuple[str, str, str], tuple[asyncio.Future, str]] = {}
+        self.stats = {
+            "calls": 0, "coalesced": 0, "pages_matched_early": 0, "pages_truncated": 0,
+            "retries": 0, "throttled": 0,
+        }
 
     async def init(self):
         self.client = httpx.AsyncClient(
@@ -45,13 +132,106 @@ class PublicProfileScraper:
             follow_redirects=True,
             timeout=httpx.Timeout(20.0, connect=10.0),
         )
+        # Chromium itself is only launched by the first Playwright fallback
+        self.browser_pool = BrowserPool(
+            context_options={"user_agent": _HEADERS["User-Agent"], "locale": "en-US"},
+        )
 
     async def close(self):
         if self.client:
             await self.client.aclose()
+        if self.browser_pool:
+            await self.browser_pool.close()
+
+    async def _fetch(self, url: str, until: Matcher | None = None) -> tuple[httpx.Response, str]:
+        """
+        Streamed GET that stops reading once `until` has seen its target block.
+        Paced per host; 429/5xx and connect failures are retried with backoff
+        (or after Retry-After). Once attempts run out, the last response is returned.
+        """
+        host = httpx.URL(url).host.removeprefix("www.")
+        retrying = AsyncRetrying(
+            # Connect failures only: a body error may have fed `until` already
+            retry=retry_if_exception_type((httpx.ConnectError, httpx.ConnectTimeout))
+            | retry_if_result(_should_retry),
+            stop=stop_after_attempt(SCRAPER_MAX_ATTEMPTS),
+            wait=_retry_wait,
+            before_sleep=self._count_retry,
+            retry_error_callback=lambda state: state.outcome.result(),
+        )
+        resp, text, outcome = await retrying(self._fetch_once, host, url, until)
+        if outcome == "matched":
+            self.stats["pages_matched_early"] += 1
+        elif outcome == "truncated":
+            self.stats["pages_truncated"] += 1
+        return resp, text
+
+    async def _fetch_once(
+        self, host: str, url: str, until: Matcher | None,
+    ) -> tuple[httpx.Response, str, str]:
+        async with self.limiter.slot(host) as slot:
+            resp, text, outcome = await fetch_text(self.client, url, until)
+            if resp.status_code in _THROTTLE_STATUSES:
+                slot.throttled = True
+            elif resp.status_code < 500:
+                slot.throttled = False
+        if resp.status_code == 429:
+            self.stats["throttled"] += 1
+            retry_after = _retry_after(resp)
+            if retry_after:
+                # Hold every request to the host, not just this one
+                self.limiter.pause(host, min(retry_after, SCRAPER_MAX_RETRY_AFTER))
+        return resp, text, outcome
+
+    def _count_retry(self, retry_state: RetryCallState):
+        self.stats["retries"] += 1
+        outcome = retry_state.outcome
+        reason = outcome.exception() if outcome.failed else f"HTTP {outcome.result()[0].status_code}"
+        logger.info(f"Retrying {retry_state.args[1]} ({reason}), attempt {retry_state.attempt_number + 1}")
+
+    async def _single_flight(self, operation: str, platform: str, username: str, scrape):
+        """
+        Run scrape() once per key while it's in flight; concurrent callers for
+        the same key await the same task and get their own copy of the result,
+        relabelled with the username as they spelled it (the key ignores case).
+        shield() keeps one caller's cancellation from cancelling the others.
+        """
+        key = (operation, platform, username.lower())
+        self.stats["calls"] += 1
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            task, scraped_as = in_flight
+            self.stats["coalesced"] += 1
+            result = copy.deepcopy(await asyncio.shield(task))
+            return _relabel(result, scraped_as, username) if scraped_as != username else result
+
+        task = asyncio.ensure_future(scrape())
+        self._in_flight[key] = (task, username)
+        task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(task)
 
     async def get_profile(self, platform: str, username: str) -> dict:
         """Get public profile metrics for a creator."""
+        return await self._single_flight(
+            "profile", platform, username, lambda: self._get_profile(platform, username)
+        )
+
+    async def get_recent_posts(self, platform: str, username: str) -> list[dict]:
+        """Get recent public posts from a creator."""
+        return await self._single_flight(
+            "posts", platform, username, lambda: self._get_recent_posts(platform, username)
+        )
+
+    async def get_profile_and_posts(self, platform: str, username: str) -> tuple[dict, list[dict]]:
+        """
+        Profile metrics and recent posts together. Fetches and parses each
+        page once instead of once per get_profile/get_recent_posts call.
+        """
+        return await self._single_flight(
+            "profile+posts", platform, username, lambda: self._get_profile_and_posts(platform, username)
+        )
+
+    async def _get_profile(self, platform: str, username: str) -> dict:
         handlers = {
             "youtube": self._scrape_youtube,
             "tiktok": self._scrape_tiktok,
@@ -68,8 +248,7 @@ class PublicProfileScraper:
             logger.error(f"Profile scrape error for {platform}/{username}: {e}")
             return self._empty_profile(username)
 
-    async def get_recent_posts(self, platform: str, username: str) -> list[dict]:
-        """Get recent public posts from a creator."""
+    async def _get_recent_posts(self, platform: str, username: str) -> list[dict]:
         try:
             if platform == "youtube":
                 return await self._get_youtube_recent_videos(username)
@@ -80,6 +259,22 @@ class PublicProfileScraper:
             logger.error(f"Recent posts error: {e}")
             return []
 
+    async def _get_profile_and_posts(self, platform: str, username: str) -> tuple[dict, list[dict]]:
+        handlers = {
+            "youtube": self._scrape_youtube_with_videos,
+            "tiktok": self._scrape_tiktok_with_posts,
+        }
+
+        handler = handlers.get(platform)
+        if not handler:
+            return await self._get_profile(platform, username), []
+
+        try:
+            return await handler(username)
+        except Exception as e:
+            logger.error(f"Profile + posts scrape error for {platform}/{username}: {e}")
+            return self._empty_profile(username), []
+
     def _empty_profile(self, username: str) -> dict:
         return {
             "platform_user_id": username,
@@ -118,14 +313,28 @@ class PublicProfileScraper:
         Scrape TikTok profile using the embedded __UNIVERSAL_DATA_FOR_REHYDRATION__ JSON,
         which contains all profile data without needing JS rendering.
         """
-        url = f"https://www.tiktok.com/@{username}"
-        resp = await self.client.get(url)
+        html = await self._fetch_tiktok_page(username)
+        return self._parse_tiktok_profile(html, self._tiktok_universal_json(html), username)
+
+    async def _scrape_tiktok_with_posts(self, username: str) -> tuple[dict, list[dict]]:
+        """Profile and recent posts from a single fetch + parse of the profile page."""
+        html = await self._fetch_tiktok_page(username)
+        data = self._tiktok_universal_json(html)
+        profile = self._parse_tiktok_profile(html, data, username)
+        return profile, self._tiktok_posts_from_universal(data) if data else []
+
+    async def _fetch_tiktok_page(self, username: str) -> str:
+        # The meta fallback lives in <head>, ahead of the rehydration script
+        resp, html = await self._fetch(
+            f"https://www.tiktok.com/@{username}",
+            ScriptBlockMatcher(TIKTOK_UNIVERSAL_MARKERS, TIKTOK_SIGI_MARKERS),
+        )
         resp.raise_for_status()
+        return html
 
-        html = resp.text
-
+    def _parse_tiktok_profile(self, html: str, data: dict | None, username: str) -> dict:
         # Strategy 1: Extract from __UNIVERSAL_DATA_FOR_REHYDRATION__ script tag
-        result = self._extract_tiktok_universal_data(html, username)
+        result = self._extract_tiktok_universal_data(data, username) if data else None
         if result and result.get("followers") is not None:
             return result
 
@@ -142,18 +351,14 @@ class PublicProfileScraper:
         logger.warning(f"TikTok: all extraction strategies failed for @{username}")
         return self._empty_profile(username)
 
-    def _extract_tiktok_universal_data(self, html: str, username: str) -> dict | None:
+    def _tiktok_universal_json(self, html: str) -> dict | None:
+        """__UNIVERSAL_DATA_FOR_REHYDRATION__ JSON pruned to the user-detail scope, or None."""
+        data = extract_embedded_json(html, TIKTOK_UNIVERSAL_MARKERS, paths=[_TIKTOK_USER_DETAIL])
+        return data if isinstance(data, dict) else None
+
+    def _extract_tiktok_universal_data(self, data: dict, username: str) -> dict | None:
         """Extract profile data from TikTok's __UNIVERSAL_DATA_FOR_REHYDRATION__ JSON."""
         try:
-            match = re.search(
-                r'<script\s+id="__UNIVERSAL_DATA_FOR_REHYDRATION__"[^>]*>(.*?)</script>',
-                html, re.DOTALL
-            )
-            if not match:
-                return None
-
-            data = json.loads(match.group(1))
-
             # Navigate to user data — structure: __DEFAULT_SCOPE__["webapp.user-detail"]
             user_detail = (
                 data.get("__DEFAULT_SCOPE__", {})
@@ -179,21 +384,20 @@ class PublicProfileScraper:
                 "followers": followers,
                 "posts_per_week": 5.0,
             }
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
+        except (KeyError, TypeError, AttributeError) as e:
             logger.debug(f"TikTok universal data extraction failed: {e}")
             return None
 
     def _extract_tiktok_sigi_state(self, html: str, username: str) -> dict | None:
         """Extract from SIGI_STATE (older TikTok page format)."""
         try:
-            match = re.search(
-                r'<script\s+id="SIGI_STATE"[^>]*>(.*?)</script>',
-                html, re.DOTALL
+            data = extract_embedded_json(
+                html, TIKTOK_SIGI_MARKERS,
+                paths=[("UserModule", "users", username), ("UserModule", "stats", username)],
             )
-            if not match:
+            if not isinstance(data, dict):
                 return None
 
-            data = json.loads(match.group(1))
             user_module = data.get("UserModule", {})
             users = user_module.get("users", {})
             stats = user_module.get("stats", {})
@@ -213,33 +417,31 @@ class PublicProfileScraper:
                 "followers": user_stats.get("followerCount"),
                 "posts_per_week": 5.0,
             }
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
+        except (KeyError, TypeError, AttributeError) as e:
             logger.debug(f"TikTok SIGI_STATE extraction failed: {e}")
             return None
 
     def _extract_tiktok_meta(self, html: str, username: str) -> dict | None:
         """Extract follower count from TikTok meta tags."""
         try:
-            soup = BeautifulSoup(html, "lxml")
+            head = extract_head_meta(html)
 
             # Try og:description or description meta
-            meta = soup.find("meta", attrs={"name": "description"})
-            if not meta:
-                meta = soup.find("meta", attrs={"property": "og:description"})
-            if not meta:
+            content = head.meta.get("description")
+            if content is None:
+                content = head.meta.get("og:description")
+            if content is None:
                 return None
 
-            content = meta.get("content", "")
             # Pattern: "123.4K Followers" or "1.2M Followers"
             match = re.search(r"([\d,.]+[KMB]?)\s*Followers", content, re.IGNORECASE)
             followers = self._parse_count(match.group(1)) if match else None
 
             # Display name from title
-            title_tag = soup.find("title")
             display_name = username
-            if title_tag and title_tag.string:
+            if head.title:
                 # Title often: "Display Name (@username) | TikTok"
-                name_match = re.match(r"^(.+?)\s*\(@", title_tag.string)
+                name_match = re.match(r"^(.+?)\s*\(@", head.title)
                 if name_match:
                     display_name = name_match.group(1).strip()
 
@@ -256,25 +458,14 @@ class PublicProfileScraper:
     async def _get_tiktok_recent_posts(self, username: str) -> list[dict]:
         """Extract recent post data from TikTok page JSON."""
         try:
-            url = f"https://www.tiktok.com/@{username}"
-            resp = await self.client.get(url)
-            resp.raise_for_status()
-
-            match = re.search(
-                r'<script\s+id="__UNIVERSAL_DATA_FOR_REHYDRATION__"[^>]*>(.*?)</script>',
-                resp.text, re.DOTALL
-            )
-            if not match:
-                return []
-
-            data = json.loads(match.group(1))
-            item_list = (
-                data.get("__DEFAULT_SCOPE__", {})
-                .get("webapp.user-detail", {})
-                .get("userInfo", {})
-                .get("user", {})
-            )
+            data = self._tiktok_universal_json(await self._fetch_tiktok_page(username))
+            return self._tiktok_posts_from_universal(data) if data else []
+        except Exception as e:
+            logger.debug(f"TikTok recent posts extraction failed: {e}")
+            return []
 
+    def _tiktok_posts_from_universal(self, data: dict) -> list[dict]:
+        try:
             # Items may be in a separate key
             items_module = (
                 data.get("__DEFAULT_SCOPE__", {})
@@ -332,12 +523,13 @@ class PublicProfileScraper:
 
         for url in urls:
             try:
-                resp = await self.client.get(url)
+                resp, html = await self._fetch(url, ScriptBlockMatcher(YOUTUBE_INITIAL_DATA_MARKERS))
                 if resp.status_code == 404:
                     continue
                 resp.raise_for_status()
 
-                result = self._extract_youtube_data(resp.text, username)
+                data = self._youtube_initial_data(html, [_YOUTUBE_HEADER])
+                result = self._extract_youtube_data(data, username) if data else None
                 if result and result.get("followers") is not None:
                     return result
             except httpx.HTTPStatusError:
@@ -346,19 +538,39 @@ class PublicProfileScraper:
         logger.warning(f"YouTube: could not scrape @{username}")
         return self._empty_profile(username)
 
-    def _extract_youtube_data(self, html: str, username: str) -> dict | None:
+    async def _scrape_youtube_with_videos(self, username: str) -> tuple[dict, list[dict]]:
+        """
+        The channel's videos tab carries both the channel header and the video
+        grid in one ytInitialData blob, so one fetch serves profile and posts.
+        """
+        resp, html = await self._fetch(
+            f"https://www.youtube.com/@{username}/videos",
+            ScriptBlockMatcher(YOUTUBE_INITIAL_DATA_MARKERS),
+        )
+        data = (
+            self._youtube_initial_data(html, [_YOUTUBE_HEADER, _YOUTUBE_TABS])
+            if resp.status_code == 200 else None
+        )
+        if not data:
+            return await self._scrape_youtube(username), []
+
+        videos = self._youtube_videos_from_data(data)
+        profile = self._extract_youtube_data(data, username)
+        if not profile or profile.get("followers") is None:
+            # Header missing from the tab page — fall back to the channel URLs
+            profile = await self._scrape_youtube(username)
+        return profile, videos
+
+    def _youtube_initial_data(self, html: str, paths: list[tuple[str, ...]]) -> dict | None:
+        """ytInitialData JSON pruned to the given paths, or None if absent/invalid."""
+        # ytInitialData is embedded as: var ytInitialData = {...};
+        # or in a <script id="ytInitialData"> tag on some pages
+        data = extract_embedded_json(html, YOUTUBE_INITIAL_DATA_MARKERS, paths=paths)
+        return data if isinstance(data, dict) else None
+
+    def _extract_youtube_data(self, data: dict, username: str) -> dict | None:
         """Extract channel data from YouTube's ytInitialData JSON."""
         try:
-            # ytInitialData is embedded as: var ytInitialData = {...};
-            match = re.search(r"var\s+ytInitialData\s*=\s*(\{.*?\});\s*</script>", html, re.DOTALL)
-            if not match:
-                # Alternative pattern
-                match = re.search(r'ytInitialData"\s*>\s*(\{.*?\})\s*</script>', html, re.DOTALL)
-            if not match:
-                return None
-
-            data = json.loads(match.group(1))
-
             # Navigate to channel header
             header = (
                 data.get("header", {})
@@ -387,7 +599,7 @@ class PublicProfileScraper:
                 "followers": followers,
                 "posts_per_week": 2.0,
             }
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
+        except (KeyError, TypeError, AttributeError) as e:
             logger.debug(f"YouTube data extraction failed: {e}")
             return None
 
@@ -435,16 +647,21 @@ class PublicProfileScraper:
     async def _get_youtube_recent_videos(self, username: str) -> list[dict]:
         """Get recent videos from YouTube channel's videos tab."""
         try:
-            resp = await self.client.get(f"https://www.youtube.com/@{username}/videos")
+            resp, html = await self._fetch(
+                f"https://www.youtube.com/@{username}/videos",
+                ScriptBlockMatcher(YOUTUBE_INITIAL_DATA_MARKERS),
+            )
             if resp.status_code != 200:
                 return []
 
-            match = re.search(r"var\s+ytInitialData\s*=\s*(\{.*?\});\s*</script>", resp.text, re.DOTALL)
-            if not match:
-                return []
-
-            data = json.loads(match.group(1))
+            data = self._youtube_initial_data(html, [_YOUTUBE_TABS])
+            return self._youtube_videos_from_data(data) if data else []
+        except Exception as e:
+            logger.debug(f"YouTube recent videos extraction failed: {e}")
+            return []
 
+    def _youtube_videos_from_data(self, data: dict) -> list[dict]:
+        try:
             # Navigate to video grid
             tabs = (
                 data.get("contents", {})
@@ -517,43 +734,39 @@ class PublicProfileScraper:
     async def _scrape_instagram_httpx(self, username: str) -> dict:
         """Extract what we can from Instagram public page meta tags."""
         try:
-            resp = await self.client.get(f"https://www.instagram.com/{username}/")
+            matcher = HeadMatcher()
+            resp, html = await self._fetch(f"https://www.instagram.com/{username}/", matcher)
             if resp.status_code != 200:
                 return self._empty_profile(username)
 
-            soup = BeautifulSoup(resp.text, "lxml")
+            # Already parsed while streaming, unless early abort is disabled
+            head = matcher.head if matcher.head.done else extract_head_meta(html)
 
             # Try meta description: "1.2M Followers, 500 Following, 300 Posts"
             followers = None
-            meta = soup.find("meta", attrs={"name": "description"})
-            if meta:
-                content = meta.get("content", "")
+            content = head.meta.get("description")
+            if content is not None:
                 match = re.search(r"([\d,.]+[KMB]?)\s*Followers", content, re.IGNORECASE)
                 if match:
                     followers = self._parse_count(match.group(1))
 
             # Try og:description as fallback
             if followers is None:
-                og_meta = soup.find("meta", attrs={"property": "og:description"})
-                if og_meta:
-                    content = og_meta.get("content", "")
+                content = head.meta.get("og:description")
+                if content is not None:
                     match = re.search(r"([\d,.]+[KMB]?)\s*Followers", content, re.IGNORECASE)
                     if match:
                         followers = self._parse_count(match.group(1))
 
             # Display name from title: "Display Name (@username) • Instagram"
             display_name = username
-            title_tag = soup.find("title")
-            if title_tag and title_tag.string:
-                title_match = re.match(r"^(.+?)\s*\(", title_tag.string)
+            if head.title:
+                title_match = re.match(r"^(.+?)\s*\(", head.title)
                 if title_match:
                     display_name = title_match.group(1).strip()
 
             # Avatar from og:image
-            avatar_url = None
-            og_image = soup.find("meta", attrs={"property": "og:image"})
-            if og_image:
-                avatar_url = og_image.get("content")
+            avatar_url = head.meta.get("og:image")
 
             return {
                 **self._empty_profile(username),
@@ -568,33 +781,17 @@ class PublicProfileScraper:
     async def _scrape_instagram_playwright(self, username: str) -> dict:
         """Use Playwright to render Instagram profile and extract data from JS-rendered DOM."""
         try:
-            from playwright.async_api import async_playwright
-
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context(
-                    user_agent=_HEADERS["User-Agent"],
-                    locale="en-US",
-                )
-                page = await context.new_page()
-
-                await page.goto(
-                    f"https://www.instagram.com/{username}/",
-                    wait_until="domcontentloaded",
-                    timeout=15000,
-                )
-                # Wait for profile content to render
-                await page.wait_for_timeout(3000)
-
-                html = await page.content()
-                await browser.close()
-
-            soup = BeautifulSoup(html, "lxml")
+            # Returns as soon as the follower count has rendered. Rendered text
+            # comes from the browser's own DOM; only the <head> is parsed here.
+            html, page_text = await self.browser_pool.render(
+                f"https://www.instagram.com/{username}/",
+                wait_for=_INSTAGRAM_FOLLOWERS_SELECTOR,
+            )
+            head = extract_head_meta(html)
 
             # Extract followers from rendered page text
             followers = None
             # Instagram renders follower counts in various formats in the page text
-            page_text = soup.get_text()
 
             # Pattern: "1,234 followers" or "1.2M followers" or "12K followers"
             follower_match = re.search(
@@ -607,17 +804,13 @@ class PublicProfileScraper:
 
             # Display name from title
             display_name = username
-            title_tag = soup.find("title")
-            if title_tag and title_tag.string:
-                title_match = re.match(r"^(.+?)\s*\(", title_tag.string)
+            if head.title:
+                title_match = re.match(r"^(.+?)\s*\(", head.title)
                 if title_match:
                     display_name = title_match.group(1).strip()
 
             # Avatar from og:image
-            avatar_url = None
-            og_image = soup.find("meta", attrs={"property": "og:image"})
-            if og_image:
-                avatar_url = og_image.get("content")
+            avatar_url = head.meta.get("og:image")
 
             return {
                 **self._empty_profile(username),
@@ -0,0 +1,134 @@
+"""
+Host Limiter — per-host pacing and adaptive concurrency for scraper requests
+Each host gets a token bucket (steady request rate with a small burst) and an
+AIMD concurrency limit: +1 slot per `limit` successful requests, halved when
+the host throttles us (429/503), so bursts back off before they turn into
+empty profiles and recover once the host does.
+"""
+import os
+import time
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
+logger = logging.getLogger(__name__)
+
+SCRAPER_HOST_RATE = float(os.getenv("SCRAPER_HOST_RATE", "2"))  # requests/second per host
+SCRAPER_HOST_BURST = max(1, int(os.getenv("SCRAPER_HOST_BURST", "5")))
+SCRAPER_HOST_MAX_CONCURRENCY = max(1, int(os.getenv("SCRAPER_HOST_MAX_CONCURRENCY", "8")))
+SCRAPER_HOST_MIN_CONCURRENCY = 1
+# A burst of throttled responses halves the limit once, not once per response
+_DECREASE_COOLDOWN_SECONDS = 2.0
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        # The lock queues waiters in arrival order, one sleeper at a time
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds: float):
+        """Hold every request to this host for `seconds` (a Retry-After)."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class AIMDLimit:
+    def __init__(self, max_limit: int, min_limit: int = SCRAPER_HOST_MIN_CONCURRENCY):
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.limit = float(max_limit)
+        self.in_flight = 0
+        self._last_decrease = 0.0
+        self._changed = asyncio.Condition()
+
+    async def acquire(self):
+        async with self._changed:
+            await self._changed.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+    async def release(self, throttled: bool | None):
+        """throttled=None: the request failed without telling us anything about load."""
+        async with self._changed:
+            self.in_flight -= 1
+            if throttled:
+                now = time.monotonic()
+                if now - self._last_decrease >= _DECREASE_COOLDOWN_SECONDS:
+                    self.limit = max(self.min_limit, self.limit / 2)
+                    self._last_decrease = now
+            elif throttled is False:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self._changed.notify_all()
+
+
+class HostLimiter:
+    """
+    Usage:
+        async with limiter.slot(host) as outcome:
+            resp = await client.get(url)
+            outcome.throttled = resp.status_code in (429, 503)
+    """
+
+    def __init__(
+        self,
+        rate: float = SCRAPER_HOST_RATE,
+        burst: int = SCRAPER_HOST_BURST,
+        max_concurrency: int = SCRAPER_HOST_MAX_CONCURRENCY,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self._buckets: dict[str, TokenBucket] = {}
+        self._limits: dict[str, AIMDLimit] = {}
+
+    def _host(self, host: str) -> tuple[TokenBucket, AIMDLimit]:
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(self.rate, self.burst)
+            self._limits[host] = AIMDLimit(self.max_concurrency)
+        return self._buckets[host], self._limits[host]
+
+    @asynccontextmanager
+    async def slot(self, host: str):
+        bucket, limit = self._host(host)
+        await limit.acquire()
+        outcome = _SlotOutcome()
+        try:
+            await bucket.acquire()
+            yield outcome
+        finally:
+            await limit.release(outcome.throttled)
+            if outcome.throttled:
+                logger.info(f"{host} throttling, concurrency limit now {int(limit.limit)}")
+
+    def pause(self, host: str, seconds: float):
+        self._host(host)[0].pause(seconds)
+
+    def snapshot(self) -> dict[str, dict]:
+        return {
+            host: {"limit": int(limit.limit), "in_flight": limit.in_flight}
+            for host, limit in self._limits.items()
+        }
+
+
+class _SlotOutcome:
+    __slots__ = ("throttled",)
+
+    def __init__(self):
+        self.throttled: bool | None = None
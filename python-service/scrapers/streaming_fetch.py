@@ -0,0 +1,126 @@
+"""
+Streaming fetch — read a page only as far as the block we parse
+The body is streamed through an incremental matcher and the connection is
+closed as soon as the matcher reports its target complete (the <head>, or
+the <script> holding an embedded JSON blob), or the body size cap is hit.
+"""
+import os
+import codecs
+import logging
+from typing import Protocol
+
+import httpx
+
+from scrapers.head_meta import HeadMetaParser
+
+logger = logging.getLogger(__name__)
+
+SCRAPER_MAX_BODY_BYTES = int(os.getenv("SCRAPER_MAX_BODY_BYTES", str(10 * 1024 * 1024)))
+# "false" reads every page to the end (still capped at SCRAPER_MAX_BODY_BYTES)
+SCRAPER_EARLY_ABORT = os.getenv("SCRAPER_EARLY_ABORT", "true").lower() == "true"
+
+_SCRIPT_END = "</script"
+
+
+class Matcher(Protocol):
+    def feed(self, chunk: str) -> bool:
+        """Consume the next piece of the body; True once the target is complete."""
+        ...
+
+
+class HeadMatcher:
+    """Complete at </head> (or the first <body> tag). The parsed head is kept on .head."""
+
+    def __init__(self):
+        self.head = HeadMetaParser()
+
+    def feed(self, chunk: str) -> bool:
+        if not self.head.done:
+            self.head.feed(chunk)
+        return self.head.done
+
+
+class ScriptBlockMatcher:
+    """
+    Complete once the <script> holding the JSON after a marker is closed.
+    Takes one marker tuple per blob the caller will extract. Within a tuple,
+    extract_embedded_json tries the markers in order and falls back to a later
+    one only if the first is absent from the whole page, which isn't known
+    until the page ends. So only each tuple's first marker completes early;
+    pages carrying just a fallback marker are read to the end.
+    A marker counts only if a '{' follows within max_gap characters, as in
+    find_embedded_json. Embedded JSON escapes '</' as '<\\/', so the first
+    '</script' after the brace ends the block.
+    """
+
+    def __init__(self, *marker_sets: tuple[str, ...], max_gap: int = 128):
+        self.markers = tuple(markers[0] for markers in marker_sets)
+        self.max_gap = max_gap
+        self._keep = max(len(m) for m in self.markers) - 1
+        self._window = ""
+        self._in_block = False
+
+    def feed(self, chunk: str) -> bool:
+        window = self._window + chunk
+        while not self._in_block:
+            hits = [(window.find(m), m) for m in self.markers]
+            hits = [(pos, m) for pos, m in hits if pos != -1]
+            if not hits:
+                self._window = window[-self._keep:]
+                return False
+            pos, marker = min(hits)
+            after = pos + len(marker)
+            brace = window.find("{", after, after + self.max_gap)
+            if brace != -1:
+                self._in_block = True
+                window = window[brace + 1:]
+            elif len(window) - after < self.max_gap:
+                # Not enough text after the marker yet to rule it in or out
+                self._window = window[pos:]
+                return False
+            else:
+                window = window[after:]
+
+        if window.find(_SCRIPT_END) != -1:
+            return True
+        self._window = window[-(len(_SCRIPT_END) - 1):]
+        return False
+
+
+async def fetch_text(
+    client: httpx.AsyncClient,
+    url: str,
+    until: Matcher | None = None,
+    max_bytes: int = SCRAPER_MAX_BODY_BYTES,
+    early_abort: bool = SCRAPER_EARLY_ABORT,
+) -> tuple[httpx.Response, str, str]:
+    """
+    GET url, streaming the body. Returns (response, text, outcome), where outcome is
+    "complete" (read to the end), "matched" (closed early by `until`) or
+    "truncated" (stopped at max_bytes). The body of a non-2xx response is not read.
+    The returned response is closed; use it for status code and headers only.
+    """
+    async with client.stream("GET", url) as resp:
+        if not resp.is_success:
+            return resp, "", "complete"
+
+        decoder = codecs.getincrementaldecoder(resp.encoding or "utf-8")(errors="replace")
+        parts: list[str] = []
+        size = 0
+        outcome = "complete"
+        async for raw in resp.aiter_bytes():
+            size += len(raw)
+            if size > max_bytes:
+                raw = raw[:len(raw) - (size - max_bytes)]
+                outcome = "truncated"
+            chunk = decoder.decode(raw)
+            parts.append(chunk)
+            if outcome == "truncated":
+                logger.info(f"Body of {url} exceeded {max_bytes} bytes, truncated")
+                break
+            if early_abort and until is not None and until.feed(chunk):
+                outcome = "matched"
+                break
+        else:
+            parts.append(decoder.decode(b"", final=True))
+        return resp, "".join(parts), outcome
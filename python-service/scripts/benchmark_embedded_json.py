@@ -0,0 +1,105 @@
+"""
+Embedded JSON benchmark — full decode vs path-pruned decode of a page blob
+Times extract_embedded_json on the same page with paths=None (everything
+decoded by the C json module) and with the paths the scraper requests, and
+reports CPU time per call and peak allocation (tracemalloc) for each.
+
+Usage (from python-service/):
+    python scripts/benchmark_embedded_json.py [--size-kb 500] [--runs 50]
+    python scripts/benchmark_embedded_json.py --html saved_channel.html
+Without --html a synthetic YouTube channel page (ytInitialData) is generated,
+shaped like the real one: a small header, video tabs, and large
+responseContext/frameworkUpdates/microformat sections the scraper never reads.
+"""
+import sys
+import json
+import time
+import random
+import argparse
+import statistics
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scrapers.embedded_json import extract_embedded_json, YOUTUBE_INITIAL_DATA_MARKERS  # noqa: E402
+
+SCENARIOS = {
+    "header": [("header",)],
+    "header+tabs": [("header",), ("contents", "twoColumnBrowseResultsRenderer", "tabs")],
+    # Worst case: a path that isn't there, so the whole blob is skipped without stopping early
+    "absent path": [("notInThePage",)],
+}
+
+
+def _synthetic_page(size_kb: int) -> str:
+    rng = random.Random(0)
+
+    def text(n: int) -> str:
+        return " ".join(rng.choice(["grow", "your", "channel", "tips", "daily", "vlog", "édition", "\"quoted\""])
+                        for _ in range(n))
+
+    def video(i: int) -> dict:
+        return {"richItemRenderer": {"content": {"videoRenderer": {
+            "videoId": f"vid{i:05d}", "title": {"runs": [{"text": text(8)}]},
+            "viewCountText": {"simpleText": f"{rng.randint(1, 10**6):,} views"},
+            "thumbnail": {"thumbnails": [{"url": f"https://i.ytimg.com/vi/{i}/{q}.jpg", "width": w}
+                                         for q, w in (("default", 120), ("mq", 320), ("hq", 480))]},
+        }}}}
+
+    filler_item = lambda i: {"key": f"entity{i}", "payload": {"text": text(20), "flags": [True, False, None, i]}}  # noqa: E731
+    data = {
+        "responseContext": {"serviceTrackingParams": [filler_item(i) for i in range(50)]},
+        "contents": {"twoColumnBrowseResultsRenderer": {"tabs": [
+            {"tabRenderer": {"title": "Videos", "content": {"richGridRenderer": {
+                "contents": [video(i) for i in range(30)]}}}},
+        ]}},
+        "header": {"pageHeaderRenderer": {"pageTitle": "Fixture Channel",
+                                          "content": {"metadata": {"text": "1.2M subscribers"}}}},
+        "metadata": {"channelMetadataRenderer": {"title": "Fixture Channel", "description": text(60)}},
+        "microformat": {"microformatDataRenderer": {"tags": [text(2) for _ in range(40)]}},
+        "frameworkUpdates": {"entityBatchUpdate": {"mutations": []}},
+    }
+    # Pad the section the scraper never reads up to the requested page size
+    mutations = data["frameworkUpdates"]["entityBatchUpdate"]["mutations"]
+    i = 0
+    while len(json.dumps(data)) < size_kb * 1024:
+        mutations.extend(filler_item(i + k) for k in range(50))
+        i += 50
+    blob = json.dumps(data, ensure_ascii=False)
+    return f"<html><head><title>Fixture</title></head><body><script>var ytInitialData = {blob};</script></body></html>"
+
+
+def _measure(html: str, paths, runs: int) -> tuple[float, float]:
+    """(median CPU ms per call, peak allocated MB for one call)"""
+    timings = []
+    for _ in range(runs):
+        started = time.process_time()
+        extract_embedded_json(html, YOUTUBE_INITIAL_DATA_MARKERS, paths=paths)
+        timings.append((time.process_time() - started) * 1000)
+    tracemalloc.start()
+    extract_embedded_json(html, YOUTUBE_INITIAL_DATA_MARKERS, paths=paths)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--html", help="saved page containing ytInitialData")
+    parser.add_argument("--size-kb", type=int, default=500)
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    html = Path(args.html).read_text() if args.html else _synthetic_page(args.size_kb)
+    print(f"page {len(html) / 1024:.0f} KB, median of {args.runs} runs\n")
+    print(f"{'decode':<16}{'CPU ms/call':>12}{'peak MB':>10}")
+    full_ms, full_mb = _measure(html, None, args.runs)
+    print(f"{'full json':<16}{full_ms:>12.2f}{full_mb:>10.2f}")
+    for name, paths in SCENARIOS.items():
+        ms, mb = _measure(html, paths, args.runs)
+        print(f"{name:<16}{ms:>12.2f}{mb:>10.2f}   ({ms / full_ms:.2f}x CPU, {mb / full_mb:.2f}x memory)")
+
+
+if __name__ == "__main__":
+    main()
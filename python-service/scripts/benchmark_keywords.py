@@ -0,0 +1,131 @@
+"""
+Keyword diversification benchmark — per-document latency and keyword overlap
+of each KEYWORD_DIVERSITY mode against KeyBERT's own Max Sum output (the
+extractor's default behaviour) and its MMR output. The maxsum and mmr rows
+double as a parity check of analyzers/keywords.py against KeyBERT.
+
+Usage (from python-service/):
+    python scripts/benchmark_keywords.py [captions.txt] [--docs 200] [--top-n 10] [--check]
+captions.txt holds one document per line; without it a built-in sample is used.
+--check gates the KEYWORD_DIVERSITY default: exits 1 unless that mode's overlap
+with KeyBERT's own selection for it (maxsum for modes KeyBERT doesn't have)
+is at least --min-overlap.
+"""
+import sys
+import time
+import argparse
+import statistics
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from analyzers.keywords import extract_keywords, DIVERSITY_MODES, KEYWORD_DIVERSITY  # noqa: E402
+
+SAMPLE_DOCS = [
+    "How I grew my fitness channel from zero to 100k followers in six months without paid ads",
+    "Three budget meal prep recipes that take under twenty minutes and cost less than five dollars",
+    "Unpopular opinion: most productivity apps make you less productive. Here's the system I use instead",
+    "Day in the life of a software engineer working remotely from Lisbon, coffee shops and all",
+    "Stop doing crunches for abs. These four core exercises actually build strength and stability",
+    "I tried the viral skincare routine for thirty days and here are my honest before and after results",
+    "The biggest mistake new investors make with index funds and how to avoid it in your twenties",
+    "Travel hack: how to find cheap flights to Japan using price alerts and flexible date search",
+    "Behind the scenes of our small bakery launch, from the first sourdough loaf to opening day",
+    "Why your houseplants keep dying: light, watering schedule and the potting mix nobody talks about",
+    "Five beginner photography tips for shooting portraits with natural window light at home",
+    "We renovated a tiny studio apartment for under two thousand dollars, full room tour and costs",
+]
+
+
+def _jaccard(a: list[str], b: list[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(set(a) & set(b)) / len(set(a) | set(b))
+
+
+def _load_docs(path: str | None, limit: int) -> list[str]:
+    if path:
+        docs = [line.strip() for line in Path(path).read_text().splitlines() if len(line.strip()) >= 20]
+    else:
+        docs = SAMPLE_DOCS
+    # Repeat the sample up to the requested count
+    return (docs * (limit // len(docs) + 1))[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("docs_file", nargs="?")
+    parser.add_argument("--docs", type=int, default=len(SAMPLE_DOCS))
+    parser.add_argument("--top-n", type=int, default=10)
+    parser.add_argument("--nr-candidates", type=int, default=20)
+    parser.add_argument("--check", action="store_true", help=f"gate the default mode ({KEYWORD_DIVERSITY})")
+    parser.add_argument("--min-overlap", type=float, default=0.95)
+    args = parser.parse_args()
+
+    from keybert import KeyBERT
+    from sentence_transformers import SentenceTransformer
+
+    docs = _load_docs(args.docs_file, args.docs)
+    kw_model = KeyBERT(model=SentenceTransformer("all-MiniLM-L6-v2"))
+
+    # The first pass embeds everything and records it; the second replays the
+    # recorded embeddings so it times candidate scoring and selection alone
+    memo: dict[str, object] = {}
+
+    def embed_and_record(texts: list[str]):
+        vectors = kw_model.model.embed(texts)
+        memo.update(zip(texts, vectors))
+        return vectors
+
+    def replay(texts: list[str]):
+        return [memo[t] for t in texts]
+
+    baselines, baseline_ms = {"maxsum": [], "mmr": []}, {"maxsum": [], "mmr": []}
+    for doc in docs:
+        for name, options in (("maxsum", {"use_maxsum": True}), ("mmr", {"use_mmr": True, "diversity": 0.5})):
+            started = time.perf_counter()
+            keywords = kw_model.extract_keywords(
+                doc, keyphrase_ngram_range=(1, 2), stop_words="english",
+                nr_candidates=args.nr_candidates, top_n=args.top_n, **options,
+            )
+            baseline_ms[name].append((time.perf_counter() - started) * 1000)
+            baselines[name].append([kw for kw, _ in keywords])
+
+    def overlap(results: list[list[str]], name: str) -> float:
+        return statistics.mean(_jaccard(r, b) for r, b in zip(results, baselines[name]))
+
+    print(f"{len(docs)} documents, top_n={args.top_n}, nr_candidates={args.nr_candidates}\n")
+    print(f"{'mode':<16}{'ms/doc':>10}{'select ms/doc':>15}{'overlap vs maxsum':>20}{'vs keybert mmr':>16}")
+    for name in ("maxsum", "mmr"):
+        print(
+            f"{'keybert ' + name:<16}{statistics.mean(baseline_ms[name]):>10.2f}{'':>15}"
+            f"{overlap(baselines[name], 'maxsum'):>20.3f}{overlap(baselines[name], 'mmr'):>16.3f}"
+        )
+    mode_overlap = {}
+    for mode in DIVERSITY_MODES:
+        timings = {}
+        for phase, embed in (("full", embed_and_record), ("select", replay)):
+            results, elapsed = [], []
+            for doc in docs:
+                started = time.perf_counter()
+                results.append(extract_keywords([doc], embed, args.top_n, args.nr_candidates, mode)[0])
+                elapsed.append((time.perf_counter() - started) * 1000)
+            timings[phase] = statistics.mean(elapsed)
+        print(
+            f"{mode:<16}{timings['full']:>10.2f}{timings['select']:>15.2f}"
+            f"{overlap(results, 'maxsum'):>20.3f}{overlap(results, 'mmr'):>16.3f}"
+        )
+        mode_overlap[mode] = overlap(results, mode if mode in baselines else "maxsum")
+
+    if args.check:
+        passed = mode_overlap[KEYWORD_DIVERSITY] >= args.min_overlap
+        print(
+            f"\ndefault {KEYWORD_DIVERSITY}: overlap {mode_overlap[KEYWORD_DIVERSITY]:.3f} "
+            f"(min {args.min_overlap}) — {'ok' if passed else 'FAILED'}"
+        )
+        if not passed:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
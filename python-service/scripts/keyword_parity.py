@@ -0,0 +1,87 @@
+"""
+Keyword model parity check — int8 vs float32 KEYWORD_MODEL_PRECISION
+Runs the service's keyword extraction with both precisions over the same
+documents and reports keyword overlap, embedding agreement, latency and
+serialized model size. Exits non-zero when the mean overlap falls below
+--min-overlap. tests/test_keyword_parity.py runs the same comparison under
+pytest (skipped when the model weights aren't available).
+
+Usage (from python-service/):
+    python scripts/keyword_parity.py [captions.txt] [--docs 200] [--min-overlap 0.8]
+"""
+import io
+import sys
+import time
+import argparse
+import statistics
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from analyzers.keywords import extract_keywords, KEYWORD_DIVERSITY  # noqa: E402
+from analyzers.content import load_keyword_model  # noqa: E402
+from scripts.benchmark_keywords import SAMPLE_DOCS, _jaccard, _load_docs  # noqa: E402
+
+
+def _model_mb(model) -> float:
+    import torch
+
+    buffer = io.BytesIO()
+    # state_dict covers the packed int8 weights, which parameters() doesn't
+    torch.save(model.state_dict(), buffer)
+    return buffer.tell() / 1e6
+
+
+def compare_precisions(docs: list[str], top_n: int = 10) -> dict:
+    """Keywords, timing and size of the float32 and int8 models over the same docs."""
+    import numpy as np
+    from keybert import KeyBERT
+
+    results, timings, embeddings, sizes = {}, {}, {}, {}
+    for precision in ("float32", "int8"):
+        model = load_keyword_model(precision)
+        sizes[precision] = _model_mb(model)
+        embed = KeyBERT(model=model).model.embed
+        embed(docs[:1])  # first-call overhead out of the timing
+        started = time.perf_counter()
+        results[precision] = [extract_keywords([doc], embed, top_n)[0] for doc in docs]
+        timings[precision] = (time.perf_counter() - started) * 1000 / len(docs)
+        embeddings[precision] = np.asarray(embed(docs), dtype=np.float32)
+
+    f, q = embeddings["float32"], embeddings["int8"]
+    return {
+        "overlaps": [_jaccard(a, b) for a, b in zip(results["float32"], results["int8"])],
+        "cosine": (f * q).sum(axis=1) / (np.linalg.norm(f, axis=1) * np.linalg.norm(q, axis=1)),
+        "ms_per_doc": timings,
+        "model_mb": sizes,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("docs_file", nargs="?")
+    parser.add_argument("--docs", type=int, default=len(SAMPLE_DOCS))
+    parser.add_argument("--top-n", type=int, default=10)
+    parser.add_argument("--min-overlap", type=float, default=0.8)
+    args = parser.parse_args()
+
+    docs = _load_docs(args.docs_file, args.docs)
+    report = compare_precisions(docs, args.top_n)
+    overlaps, cosine = report["overlaps"], report["cosine"]
+    mean_overlap = statistics.mean(overlaps)
+
+    print(f"{len(docs)} documents, top_n={args.top_n}, diversity={KEYWORD_DIVERSITY}\n")
+    print(f"{'precision':<12}{'ms/doc':>10}{'model MB':>12}")
+    for precision in ("float32", "int8"):
+        print(f"{precision:<12}{report['ms_per_doc'][precision]:>10.2f}{report['model_mb'][precision]:>12.1f}")
+    print(f"\nkeyword overlap (Jaccard): mean {mean_overlap:.3f}, min {min(overlaps):.3f}")
+    print(f"document embedding cosine: mean {cosine.mean():.4f}, min {cosine.min():.4f}")
+
+    if mean_overlap < args.min_overlap:
+        print(f"\nFAIL: mean overlap {mean_overlap:.3f} < {args.min_overlap}")
+        sys.exit(1)
+    print("\nOK")
+
+
+if __name__ == "__main__":
+    main()
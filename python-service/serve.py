@@ -0,0 +1,19 @@
+"""
+Process entry point — `python serve.py` (the Dockerfile CMD)
+Analyzer and yt-dlp worker processes are spawned, and spawn re-imports the
+parent's entry script in every worker (as __mp_main__). Starting from this
+module instead of main.py keeps that re-import to nothing: FastAPI, structlog
+and the app itself load only in the web process.
+"""
+import os
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # PORT is read here at runtime (no shell expansion needed)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8000")),
+        reload=os.getenv("ENV", "production") == "development",
+    )
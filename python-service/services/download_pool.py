@@ -0,0 +1,171 @@
+"""
+Download Worker Pool — long-lived yt-dlp worker processes
+Each worker imports yt-dlp once and downloads through its Python API, so a
+post no longer pays for a fresh interpreter and extractor registration.
+A download that times out or is cancelled kills its worker (the only way to
+stop yt-dlp mid-download); a fresh one is spawned on next use.
+"""
+import os
+import asyncio
+import logging
+import multiprocessing
+from multiprocessing.connection import Connection
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DOWNLOAD_WORKERS = max(1, int(os.getenv("DOWNLOAD_WORKERS", "4")))
+# Workers are replaced after this many downloads, bounding any leak in extractors
+DOWNLOAD_WORKER_MAX_JOBS = max(1, int(os.getenv("DOWNLOAD_WORKER_MAX_JOBS", "200")))
+
+
+# ─── Worker process side ──────────────────────────────────────────────────────
+
+class _SilentLogger:
+    """yt-dlp prints errors even when quiet; they're returned to the parent instead."""
+
+    def debug(self, msg):
+        pass
+
+    info = warning = error = debug
+
+
+def _worker_main(conn: Connection):
+    import yt_dlp
+
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        url, output_path, max_size_mb = job
+        output = Path(output_path)
+        options = {
+            "format": "bestaudio/best",
+            # yt-dlp picks the download's extension; the MP3 post-processor replaces it
+            "outtmpl": str(output.with_suffix("")) + ".%(ext)s",
+            "postprocessors": [{
+                "key": "FFmpegExtractAudio",
+                "preferredcodec": "mp3",
+                "preferredquality": "5",  # lower quality = smaller file
+            }],
+            "max_filesize": max_size_mb * 1024 * 1024,
+            "noplaylist": True,
+            "quiet": True,
+            "no_warnings": True,
+            "noprogress": True,
+            "logger": _SilentLogger(),
+        }
+        try:
+            with yt_dlp.YoutubeDL(options) as ydl:
+                ydl.download([url])
+            conn.send((output.exists(), None))
+        except Exception as e:
+            conn.send((False, str(e)[:200]))
+
+
+# ─── Parent side ──────────────────────────────────────────────────────────────
+
+class _Worker:
+    def __init__(self, process: multiprocessing.Process, conn: Connection):
+        self.process = process
+        self.conn = conn
+        self.jobs = 0
+
+
+class DownloadWorkerPool:
+    """
+    Usage: ok = await pool.download(url, "/tmp/x/audio.mp3", max_size_mb=25, timeout=60)
+    At most `size` downloads run at once; further callers wait for a worker.
+    """
+
+    def __init__(self, size: int = DOWNLOAD_WORKERS, max_jobs: int = DOWNLOAD_WORKER_MAX_JOBS):
+        self.size = size
+        self.max_jobs = max_jobs
+        # spawn, not fork — the web process may have loaded torch
+        self._context = multiprocessing.get_context("spawn")
+        self._slots = asyncio.Semaphore(size)
+        self._idle: list[_Worker] = []
+        self._busy: set[_Worker] = set()
+
+    async def download(self, url: str, output_path: str, max_size_mb: int, timeout: float) -> bool:
+        """Download url's audio as an MP3 at output_path. Raises asyncio.TimeoutError on timeout."""
+        async with self._slots:
+            worker = self._idle.pop() if self._idle else await asyncio.to_thread(self._spawn)
+            self._busy.add(worker)
+            reusable = False
+            try:
+                worker.conn.send((url, output_path, max_size_mb))
+                ok, error = await asyncio.wait_for(self._receive(worker), timeout)
+                reusable = True
+                if error:
+                    logger.debug(f"yt-dlp failed: {error}")
+                return ok
+            finally:
+                self._busy.discard(worker)
+                worker.jobs += 1
+                if reusable and worker.jobs < self.max_jobs:
+                    self._idle.append(worker)
+                else:
+                    # Timed out, cancelled, crashed or worn out. Joined on a
+                    # thread: a blocking join here would stall the event loop
+                    self._signal(worker, kill=not reusable)
+                    asyncio.get_running_loop().run_in_executor(None, self._reap, worker, not reusable)
+
+    def close(self):
+        for worker in self._idle:
+            self._stop(worker, kill=False)
+        for worker in list(self._busy):
+            self._stop(worker, kill=True)
+        self._idle = []
+        self._busy.clear()
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main, args=(child_conn,), name="yt-dlp-worker", daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        logger.info(f"Started yt-dlp worker (pid {process.pid})")
+        return _Worker(process, parent_conn)
+
+    @staticmethod
+    async def _receive(worker: _Worker) -> tuple[bool, str | None]:
+        """Wait for the worker's reply without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        readable = loop.create_future()
+        fd = worker.conn.fileno()
+        loop.add_reader(fd, lambda: readable.done() or readable.set_result(None))
+        try:
+            await readable
+        finally:
+            loop.remove_reader(fd)
+        # EOFError here means the worker died mid-download
+        return worker.conn.recv()
+
+    @classmethod
+    def _stop(cls, worker: _Worker, kill: bool):
+        cls._signal(worker, kill)
+        cls._reap(worker, kill)
+
+    @staticmethod
+    def _signal(worker: _Worker, kill: bool):
+        try:
+            if kill:
+                worker.process.kill()
+            else:
+                worker.conn.send(None)
+        except (OSError, ValueError):
+            pass
+
+    @staticmethod
+    def _reap(worker: _Worker, killed: bool):
+        """Blocking: wait for the worker to exit, killing it if a graceful stop hangs."""
+        worker.process.join(timeout=1 if killed else 5)
+        if worker.process.is_alive():
+            worker.process.kill()
+            worker.process.join(timeout=1)
+        worker.conn.close()
@@ -0,0 +1,145 @@
+"""
+Embedding Batcher — cross-request micro-batching in front of the keyword model
+Analyzer threads hand their texts to one scheduler thread, which collects
+texts for up to EMBEDDING_BATCH_MAX_WAIT_MS (or until EMBEDDING_BATCH_MAX_SIZE
+are queued), runs a single forward pass and gives each caller its rows.
+Concurrent /analyze/* calls then share batches instead of each running small
+passes that compete for torch's threads.
+Texts are queued individually: a request larger than the max batch size is
+spread over several passes, and a text already queued or being embedded for
+another caller is waited on rather than embedded again.
+"""
+import os
+import time
+import logging
+import threading
+from collections import deque
+from typing import Callable
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_BATCH_MAX_SIZE = max(1, int(os.getenv("EMBEDDING_BATCH_MAX_SIZE", "128")))  # texts per forward pass
+EMBEDDING_BATCH_MAX_WAIT_MS = float(os.getenv("EMBEDDING_BATCH_MAX_WAIT_MS", "5"))
+
+
+class _Pending:
+    __slots__ = ("text", "done", "vector", "error")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.done = threading.Event()
+        self.vector: np.ndarray | None = None
+        self.error: BaseException | None = None
+
+
+class EmbeddingBatcher:
+    """
+    Usage: vectors = batcher.embed(texts)  # from any thread; blocks until embedded
+    compute() only ever runs on the batcher's own thread.
+    """
+
+    def __init__(
+        self,
+        compute: Callable[[list[str]], np.ndarray],
+        max_batch: int = EMBEDDING_BATCH_MAX_SIZE,
+        max_wait_ms: float = EMBEDDING_BATCH_MAX_WAIT_MS,
+    ):
+        self.compute = compute
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._changed = threading.Condition()
+        self._queue: deque[_Pending] = deque()
+        # text → its pending entry, from queueing until its pass finishes
+        self._in_flight: dict[str, _Pending] = {}
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        self._stats = {"batches": 0, "requests": 0, "texts": 0, "shared": 0, "largest_batch": 0}
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        entries: dict[str, _Pending] = {}
+        with self._changed:
+            self._ensure_thread()
+            self._stats["requests"] += 1
+            for text in dict.fromkeys(texts):
+                entry = self._in_flight.get(text)
+                if entry is None:
+                    entry = self._in_flight[text] = _Pending(text)
+                    self._queue.append(entry)
+                else:
+                    self._stats["shared"] += 1
+                entries[text] = entry
+            self._changed.notify()
+        for entry in entries.values():
+            entry.done.wait()
+            if entry.error is not None:
+                raise entry.error
+        return np.stack([entries[text].vector for text in texts])
+
+    def stats(self) -> dict:
+        batches = self._stats["batches"]
+        return {
+            **self._stats,
+            "mean_batch": round(self._stats["texts"] / batches, 1) if batches else None,
+            "max_batch": self.max_batch,
+            "max_wait_ms": self.max_wait * 1000,
+        }
+
+    def close(self):
+        with self._changed:
+            self._closed = True
+            self._changed.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _ensure_thread(self):
+        # Caller holds the condition's lock
+        if self._thread is None:
+            self._closed = False
+            self._thread = threading.Thread(target=self._run, name="embedding-batcher", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            if batch is None:
+                return
+            self._process(batch)
+
+    def _collect(self) -> list[_Pending] | None:
+        """Up to max_batch queued texts, waiting up to max_wait for the batch to fill."""
+        with self._changed:
+            while not self._queue:
+                if self._closed:
+                    return None
+                self._changed.wait()
+            deadline = time.monotonic() + self.max_wait
+            while len(self._queue) < self.max_batch and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._changed.wait(remaining)
+            return [self._queue.popleft() for _ in range(min(self.max_batch, len(self._queue)))]
+
+    def _process(self, batch: list[_Pending]):
+        try:
+            vectors = np.asarray(self.compute([entry.text for entry in batch]), dtype=np.float32)
+        except BaseException as e:
+            vectors = None
+            for entry in batch:
+                entry.error = e
+        with self._changed:
+            for i, entry in enumerate(batch):
+                if vectors is not None:
+                    entry.vector = vectors[i]
+                entry.done.set()
+                # Later callers for this text go back to the cache (or a new pass)
+                del self._in_flight[entry.text]
+            if vectors is not None:
+                self._stats["batches"] += 1
+                self._stats["texts"] += len(batch)
+                self._stats["largest_batch"] = max(self._stats["largest_batch"], len(batch))
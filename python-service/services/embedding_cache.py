@@ -0,0 +1,211 @@
+"""
+Embedding Cache — in-memory LRU in front of a memory-mapped NumPy store
+Keyed by a hash of the normalized text, so captions, transcripts and the
+candidate n-grams that recur across posts (hashtags, niche terms) are embedded
+once. The disk tier is a fixed-capacity ring of rows that survives restarts:
+  vectors.f32  (capacity × dim float32, memmap)
+  keys.bin     (capacity × 16-byte text hashes, memmap; all-zero = empty row)
+  meta.json    (model, dim, capacity, next row to overwrite)
+Only one process owns the disk tier (flock); others fall back to memory only.
+"""
+import os
+import json
+import fcntl
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_CACHE_DIR = os.getenv("EMBEDDING_CACHE_DIR", ".cache/embeddings")  # "" disables disk tier
+EMBEDDING_CACHE_MEMORY_ITEMS = int(os.getenv("EMBEDDING_CACHE_MEMORY_ITEMS", "20000"))
+EMBEDDING_CACHE_DISK_ROWS = int(os.getenv("EMBEDDING_CACHE_DISK_ROWS", "200000"))  # ~300 MB at 384 dims (sparse until filled)
+
+_KEY_BYTES = 16
+_META_EVERY = 256  # disk writes between meta.json saves
+
+
+def text_key(text: str) -> bytes:
+    """Hash of the text as the model sees it (MiniLM is uncased; whitespace runs collapse)."""
+    normalized = " ".join(text.lower().split())
+    return hashlib.blake2b(normalized.encode(), digest_size=_KEY_BYTES).digest()
+
+
+class _DiskStore:
+    def __init__(self, directory: Path, model: str, dim: int, capacity: int):
+        directory.mkdir(parents=True, exist_ok=True)
+        self._lock_file = open(directory / "lock", "w")
+        # Raises BlockingIOError if another process owns the store
+        fcntl.flock(self._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+        self.meta_path = directory / "meta.json"
+        meta = json.loads(self.meta_path.read_text()) if self.meta_path.exists() else {}
+        expected = {"model": model, "dim": dim, "capacity": capacity}
+        fresh = {k: meta.get(k) for k in expected} != expected
+        if fresh and meta:
+            logger.info(f"Embedding cache at {directory} built for {meta}, starting over")
+        mode = "w+" if fresh else "r+"
+        self.vectors = np.memmap(directory / "vectors.f32", dtype=np.float32, mode=mode, shape=(capacity, dim))
+        self.keys = np.memmap(directory / "keys.bin", dtype=np.uint8, mode=mode, shape=(capacity, _KEY_BYTES))
+        self.meta = {**expected, "next_row": 0 if fresh else meta.get("next_row", 0)}
+        self.capacity = capacity
+
+        self.index: dict[bytes, int] = {}
+        for row in np.flatnonzero(self.keys.any(axis=1)):
+            self.index[self.keys[row].tobytes()] = int(row)
+        self._writes = 0
+        if fresh:
+            self._save_meta()
+
+    def get(self, key: bytes) -> np.ndarray | None:
+        row = self.index.get(key)
+        return None if row is None else np.array(self.vectors[row])
+
+    def put(self, key: bytes, vector: np.ndarray):
+        if key in self.index:
+            return
+        row = self.meta["next_row"]
+        old_key = self.keys[row].tobytes()
+        if any(old_key):
+            self.index.pop(old_key, None)
+        # Vector before key: a key on disk always has its vector behind it
+        self.vectors[row] = vector
+        self.keys[row] = np.frombuffer(key, dtype=np.uint8)
+        self.index[key] = row
+        self.meta["next_row"] = (row + 1) % self.capacity
+        self._writes += 1
+        if self._writes % _META_EVERY == 0:
+            self._save_meta()
+
+    def _save_meta(self):
+        self.meta_path.write_text(json.dumps(self.meta))
+
+    def close(self):
+        self.vectors.flush()
+        self.keys.flush()
+        self._save_meta()
+        self._lock_file.close()
+
+
+class EmbeddingCache:
+    """
+    Usage: vectors = cache.embed(texts, compute=model.embed)
+    compute() is called once per embed() with only the texts not cached.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        directory: str = EMBEDDING_CACHE_DIR,
+        memory_items: int = EMBEDDING_CACHE_MEMORY_ITEMS,
+        disk_rows: int = EMBEDDING_CACHE_DISK_ROWS,
+    ):
+        self.model = model
+        self.directory = Path(directory) / model.replace("/", "__") if directory else None
+        self.memory_items = memory_items
+        self.disk_rows = disk_rows
+        self._memory: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        self._disk: _DiskStore | None = None
+        self._disk_failed = not self.directory
+        self._disk_absent = False  # no store on disk yet: lookups skip it until the first write
+        self._lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+    def embed(self, texts: list[str], compute: Callable[[list[str]], np.ndarray]) -> np.ndarray:
+        keys = [text_key(text) for text in texts]
+        found: dict[bytes, np.ndarray] = {}
+        missing: dict[bytes, str] = {}
+        with self._lock:
+            for key, text in zip(keys, texts):
+                if key in found or key in missing:
+                    continue
+                vector = self._lookup(key)
+                if vector is None:
+                    missing[key] = text
+                else:
+                    found[key] = vector
+            self._stats["misses"] += len(missing)
+
+        if missing:
+            # The forward pass runs outside the lock; concurrent misses on the same text are rare
+            computed = np.asarray(compute(list(missing.values())), dtype=np.float32)
+            with self._lock:
+                for key, vector in zip(missing, computed):
+                    self._remember(key, vector)
+                    self._store(key, vector)
+                    found[key] = vector
+        return np.stack([found[key] for key in keys]) if keys else np.empty((0, 0), dtype=np.float32)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = sum(self._stats.values())
+            hits = self._stats["memory_hits"] + self._stats["disk_hits"]
+            return {
+                **self._stats,
+                "hit_rate": round(hits / lookups, 3) if lookups else None,
+                "memory_items": len(self._memory),
+                "memory_bytes": sum(v.nbytes for v in self._memory.values()),
+                "disk_rows": len(self._disk.index) if self._disk else None,
+                "disk_bytes": (self._disk.vectors.nbytes + self._disk.keys.nbytes) if self._disk else None,
+            }
+
+    def close(self):
+        with self._lock:
+            if self._disk:
+                self._disk.close()
+                self._disk = None
+
+    # ─── Internals (caller holds the lock) ───────────────────────────────────
+
+    def _lookup(self, key: bytes) -> np.ndarray | None:
+        vector = self._memory.get(key)
+        if vector is not None:
+            self._memory.move_to_end(key)
+            self._stats["memory_hits"] += 1
+            return vector
+        if self._ensure_disk():
+            vector = self._disk.get(key)
+            if vector is not None:
+                self._remember(key, vector)
+                self._stats["disk_hits"] += 1
+                return vector
+        return None
+
+    def _remember(self, key: bytes, vector: np.ndarray):
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def _store(self, key: bytes, vector: np.ndarray):
+        if self._ensure_disk(dim=len(vector)):
+            self._disk.put(key, vector)
+
+    def _ensure_disk(self, dim: int | None = None) -> bool:
+        """
+        Open the disk tier if possible. The embedding size comes from an existing
+        store's meta.json, else from the first vector written (dim).
+        """
+        if self._disk is not None or self._disk_failed:
+            return self._disk is not None
+        try:
+            if dim is None:
+                meta_path = self.directory / "meta.json"
+                if self._disk_absent or not meta_path.exists():
+                    self._disk_absent = True
+                    return False
+                dim = json.loads(meta_path.read_text())["dim"]
+            self._disk = _DiskStore(self.directory, self.model, dim, self.disk_rows)
+            logger.info(f"Embedding cache disk tier at {self.directory} ({len(self._disk.index)} rows)")
+        except BlockingIOError:
+            logger.info(f"Embedding cache at {self.directory} owned by another process, memory only")
+            self._disk_failed = True
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Embedding cache disk tier disabled: {e}")
+            self._disk_failed = True
+        return self._disk is not None
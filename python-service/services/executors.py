@@ -0,0 +1,99 @@
+"""
+Analyzer Executors — run CPU-bound analyzer work off the asyncio event loop
+Each analyzer gets its own pool so a long KeyBERT batch can't starve the fast
+regex/VADER passes, and /health keeps responding while models run.
+"""
+import os
+import asyncio
+import logging
+import importlib
+import functools
+import multiprocessing
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# "thread" shares the already-loaded analyzers with the web process.
+# "process" gives each pool its own interpreter (and its own copy of the model).
+EXECUTOR_KIND = os.getenv("ANALYZER_EXECUTOR", "thread")
+
+# pool name → (analyzer class path, default pool size)
+# KeyBERT gets its own pool so keyword batches don't queue ahead of hook/CTA work.
+POOLS = {
+    "content": ("analyzers.content:ContentAnalyzer", 2),
+    "keywords": ("analyzers.content:ContentAnalyzer", 1),
+    "sentiment": ("analyzers.sentiment:SentimentAnalyzer", 2),
+    "hashtags": ("analyzers.hashtags:HashtagAnalyzer", 1),
+}
+
+
+# Thread-mode overrides. Keyword threads share one model through the embedding
+# batcher, so several can wait on it at once without loading more copies.
+THREAD_POOL_SIZES = {"keywords": 4}
+
+
+def _pool_size(name: str, default: int) -> int:
+    return max(1, int(os.getenv(f"{name.upper()}_POOL_SIZE", str(default))))
+
+
+# ─── Process-pool worker side ─────────────────────────────────────────────────
+# Analyzer instances can't be pickled across processes (KeyBERT holds a torch
+# model), so each worker builds its own on first use.
+
+_worker_analyzers: dict[str, object] = {}
+
+
+def _worker_call(class_path: str, method: str, *args):
+    analyzer = _worker_analyzers.get(class_path)
+    if analyzer is None:
+        module_name, class_name = class_path.split(":")
+        analyzer = getattr(importlib.import_module(module_name), class_name)()
+        _worker_analyzers[class_path] = analyzer
+    return getattr(analyzer, method)(*args)
+
+
+class AnalyzerExecutors:
+    """
+    Dispatches analyzer method calls to per-analyzer executor pools.
+    Usage: await executors.run("sentiment", "analyze", text)
+    """
+
+    def __init__(self, analyzers: list[object], kind: str = EXECUTOR_KIND):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown executor kind: {kind}")
+        self.kind = kind
+        # class path → in-process instance, used by thread pools
+        self._analyzers = {
+            f"{type(a).__module__}:{type(a).__name__}": a for a in analyzers
+        }
+        self._pools: dict[str, Executor] = {}
+
+    def _pool(self, name: str) -> Executor:
+        pool = self._pools.get(name)
+        if pool is None:
+            default = POOLS[name][1] if self.kind == "process" else THREAD_POOL_SIZES.get(name, POOLS[name][1])
+            size = _pool_size(name, default)
+            if self.kind == "process":
+                # spawn, not fork — forking a process that has loaded torch deadlocks
+                pool = ProcessPoolExecutor(
+                    max_workers=size, mp_context=multiprocessing.get_context("spawn")
+                )
+            else:
+                pool = ThreadPoolExecutor(max_workers=size, thread_name_prefix=f"{name}-pool")
+            self._pools[name] = pool
+            logger.info(f"Started {self.kind} pool '{name}' with {size} workers")
+        return pool
+
+    async def run(self, pool: str, method: str, *args):
+        """Run analyzer.method(*args) on the named pool and await the result."""
+        class_path = POOLS[pool][0]
+        if self.kind == "process":
+            fn = functools.partial(_worker_call, class_path, method, *args)
+        else:
+            fn = functools.partial(getattr(self._analyzers[class_path], method), *args)
+        return await asyncio.get_running_loop().run_in_executor(self._pool(pool), fn)
+
+    def shutdown(self):
+        for pool in self._pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+        self._pools.clear()
@@ -0,0 +1,124 @@
+"""
+Job Manager — background jobs for long analyses
+Jobs are queued (bounded), run by a fixed pool of worker tasks, and kept in
+memory with progress and partial results until they expire.
+"""
+import os
+import time
+import uuid
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+JOB_QUEUE_SIZE = int(os.getenv("JOB_QUEUE_SIZE", "100"))
+JOB_RESULT_TTL_SECONDS = int(os.getenv("JOB_RESULT_TTL_SECONDS", "3600"))
+
+
+class JobQueueFull(Exception):
+    """Raised by submit() when the queue is at JOB_QUEUE_SIZE."""
+
+
+class Job:
+    def __init__(self, kind: str, total: int, run: Callable[["Job"], Awaitable[dict]]):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.status = "queued"  # queued | running | completed | failed
+        self.total = total
+        self.completed = 0
+        self.partial_results: list[dict] = []
+        self.result: dict | None = None
+        self.error: str | None = None
+        self.created_at = datetime.now(timezone.utc)
+        self.finished_at: datetime | None = None
+        self._run = run
+        self._finished_monotonic: float | None = None
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "progress": round(self.completed / self.total, 3) if self.total else 0.0,
+            "completed_items": self.completed,
+            "total_items": self.total,
+            "partial_results": self.partial_results if self.result is None else [],
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class JobManager:
+    """
+    Bounded job queue + worker pool. Finished jobs are dropped
+    JOB_RESULT_TTL_SECONDS after completion.
+    """
+
+    def __init__(
+        self,
+        workers: int = JOB_WORKERS,
+        queue_size: int = JOB_QUEUE_SIZE,
+        ttl_seconds: int = JOB_RESULT_TTL_SECONDS,
+    ):
+        self.workers = workers
+        self.ttl = ttl_seconds
+        self._queue: asyncio.Queue[Job] = asyncio.Queue(maxsize=queue_size)
+        self._jobs: dict[str, Job] = {}
+        self._worker_tasks: list[asyncio.Task] = []
+
+    def submit(self, kind: str, total: int, run: Callable[[Job], Awaitable[dict]]) -> Job:
+        """Queue a job. run(job) does the work, updating job progress as it goes."""
+        self._expire()
+        if not self._worker_tasks:
+            self._worker_tasks = [
+                asyncio.create_task(self._worker(i)) for i in range(self.workers)
+            ]
+        job = Job(kind, total, run)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise JobQueueFull(f"Job queue full ({self._queue.maxsize} jobs waiting)")
+        self._jobs[job.id] = job
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        self._expire()
+        return self._jobs.get(job_id)
+
+    async def close(self):
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+
+    async def _worker(self, index: int):
+        while True:
+            job = await self._queue.get()
+            job.status = "running"
+            try:
+                job.result = await job._run(job)
+                job.status = "completed"
+            except asyncio.CancelledError:
+                job.status, job.error = "failed", "Service shutting down"
+                raise
+            except Exception as e:
+                logger.error(f"Job {job.id} ({job.kind}) failed: {e}")
+                job.status, job.error = "failed", str(e)
+            finally:
+                job.finished_at = datetime.now(timezone.utc)
+                job._finished_monotonic = time.monotonic()
+                self._queue.task_done()
+
+    def _expire(self):
+        cutoff = time.monotonic() - self.ttl
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job._finished_monotonic is not None and job._finished_monotonic < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
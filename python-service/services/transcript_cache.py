@@ -0,0 +1,195 @@
+"""
+Transcript Cache — in-memory LRU in front of a SQLite store
+Keyed by normalized media URL so repeat analyses of an account skip the
+yt-dlp download and Whisper call entirely. An optional audio hash catches
+the same audio re-posted under a different URL (skips Whisper, not download).
+"""
+import os
+import time
+import sqlite3
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+logger = logging.getLogger(__name__)
+
+TRANSCRIPT_CACHE_PATH = os.getenv("TRANSCRIPT_CACHE_PATH", ".cache/transcripts.sqlite3")  # "" disables disk tier
+TRANSCRIPT_CACHE_MEMORY_ITEMS = int(os.getenv("TRANSCRIPT_CACHE_MEMORY_ITEMS", "512"))
+TRANSCRIPT_CACHE_MAX_ROWS = int(os.getenv("TRANSCRIPT_CACHE_MAX_ROWS", "50000"))
+TRANSCRIPT_CACHE_TTL_DAYS = float(os.getenv("TRANSCRIPT_CACHE_TTL_DAYS", "30"))
+TRANSCRIPT_CACHE_AUDIO_HASH = os.getenv("TRANSCRIPT_CACHE_AUDIO_HASH", "true").lower() == "true"
+
+# Signed CDN URLs carry expiring tokens in the query — the path alone identifies the asset
+_CDN_HOST_SUFFIXES = ("cdninstagram.com", "fbcdn.net", "tiktokcdn.com", "tiktokcdn-us.com")
+# googlevideo serves everything from /videoplayback — the stream is identified by these params
+_GOOGLEVIDEO_PARAMS = {"id", "itag"}
+_TRACKING_PARAMS = {"si", "feature", "igsh", "igshid", "is_from_webapp", "sender_device", "_r", "_t", "pp"}
+_PRUNE_EVERY = 100  # writes between eviction sweeps
+
+
+def normalize_media_url(url: str) -> str:
+    """
+    Canonical form of a media URL: lowercase host without www./m., no fragment,
+    no tracking params, sorted query. YouTube short links map to watch?v=,
+    and watch URLs keep only v (t= and playlist params don't change the audio).
+    """
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    for prefix in ("www.", "m."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    path = parts.path.rstrip("/")
+
+    if host == "youtu.be":
+        host, path, query = "youtube.com", "/watch", [("v", path.lstrip("/"))]
+    elif host == "youtube.com" and path.startswith("/shorts/"):
+        path, query = "/watch", [("v", path[len("/shorts/"):])]
+    elif host == "youtube.com" and path == "/watch":
+        query = [(k, v) for k, v in parse_qsl(parts.query) if k == "v"]
+    elif host.endswith("googlevideo.com"):
+        query = [(k, v) for k, v in parse_qsl(parts.query) if k in _GOOGLEVIDEO_PARAMS]
+    elif host.endswith(_CDN_HOST_SUFFIXES):
+        query = []
+    else:
+        query = [
+            (k, v) for k, v in parse_qsl(parts.query)
+            if k not in _TRACKING_PARAMS and not k.startswith("utm_")
+        ]
+    return urlunsplit(("https", host, path, urlencode(sorted(query)), ""))
+
+
+def audio_fingerprint(audio: str | Path | bytes) -> str:
+    """SHA-256 of downloaded audio (a file path or the bytes themselves)."""
+    if isinstance(audio, bytes):
+        return hashlib.sha256(audio).hexdigest()
+    digest = hashlib.sha256()
+    with open(audio, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class TranscriptCache:
+    """
+    Two-tier transcript cache. Entries expire after TRANSCRIPT_CACHE_TTL_DAYS;
+    the disk tier is also capped at TRANSCRIPT_CACHE_MAX_ROWS (least recently
+    used rows are evicted first).
+    """
+
+    def __init__(
+        self,
+        path: str = TRANSCRIPT_CACHE_PATH,
+        memory_items: int = TRANSCRIPT_CACHE_MEMORY_ITEMS,
+        max_rows: int = TRANSCRIPT_CACHE_MAX_ROWS,
+        ttl_days: float = TRANSCRIPT_CACHE_TTL_DAYS,
+    ):
+        self.memory_items = memory_items
+        self.max_rows = max_rows
+        self.ttl = ttl_days * 86400
+        # key → (transcript, created_at)
+        self._memory: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._db: sqlite3.Connection | None = None
+        if path:
+            try:
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+                self._db = sqlite3.connect(path, check_same_thread=False)
+                self._db.executescript("""
+                    PRAGMA journal_mode=WAL;
+                    CREATE TABLE IF NOT EXISTS transcripts (
+                        key TEXT PRIMARY KEY,
+                        audio_hash TEXT,
+                        transcript TEXT NOT NULL,
+                        created_at REAL NOT NULL,
+                        last_used REAL NOT NULL
+                    );
+                    CREATE INDEX IF NOT EXISTS transcripts_audio_hash ON transcripts (audio_hash);
+                """)
+            except sqlite3.Error as e:
+                logger.warning(f"Transcript cache disk tier disabled: {e}")
+                self._db = None
+
+    @staticmethod
+    def key(media_url: str, language: str) -> str:
+        return f"{language}:{normalize_media_url(media_url)}"
+
+    async def get(self, key: str) -> str | None:
+        return await asyncio.to_thread(self._get, key)
+
+    async def get_by_audio(self, audio_hash: str) -> str | None:
+        return await asyncio.to_thread(self._get_by_audio, audio_hash)
+
+    async def put(self, key: str, transcript: str, audio_hash: str | None = None):
+        await asyncio.to_thread(self._put, key, transcript, audio_hash)
+
+    def close(self):
+        if self._db:
+            self._db.close()
+            self._db = None
+
+    # ─── Sync internals (run on a worker thread) ─────────────────────────────
+
+    def _remember(self, key: str, transcript: str, created_at: float):
+        self._memory[key] = (transcript, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def _get(self, key: str) -> str | None:
+        now = time.time()
+        with self._lock:
+            hit = self._memory.get(key)
+            if hit and now - hit[1] < self.ttl:
+                self._memory.move_to_end(key)
+                return hit[0]
+            if not self._db:
+                return None
+            row = self._db.execute(
+                "SELECT transcript, created_at FROM transcripts WHERE key = ?", (key,)
+            ).fetchone()
+            if not row or now - row[1] >= self.ttl:
+                return None
+            self._db.execute("UPDATE transcripts SET last_used = ? WHERE key = ?", (now, key))
+            self._db.commit()
+            self._remember(key, row[0], row[1])
+            return row[0]
+
+    def _get_by_audio(self, audio_hash: str) -> str | None:
+        if not self._db:
+            return None
+        with self._lock:
+            row = self._db.execute(
+                "SELECT transcript FROM transcripts WHERE audio_hash = ? AND created_at > ? LIMIT 1",
+                (audio_hash, time.time() - self.ttl),
+            ).fetchone()
+        return row[0] if row else None
+
+    def _put(self, key: str, transcript: str, audio_hash: str | None):
+        now = time.time()
+        with self._lock:
+            self._remember(key, transcript, now)
+            if not self._db:
+                return
+            self._db.execute(
+                "INSERT OR REPLACE INTO transcripts (key, audio_hash, transcript, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, audio_hash, transcript, now, now),
+            )
+            self._writes += 1
+            if self._writes % _PRUNE_EVERY == 0:
+                self._prune(now)
+            self._db.commit()
+
+    def _prune(self, now: float):
+        self._db.execute("DELETE FROM transcripts WHERE created_at <= ?", (now - self.ttl,))
+        self._db.execute(
+            "DELETE FROM transcripts WHERE key IN ("
+            "  SELECT key FROM transcripts ORDER BY last_used DESC LIMIT -1 OFFSET ?"
+            ")",
+            (self.max_rows,),
+        )
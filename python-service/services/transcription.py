@@ -1,23 +1,78 @@
 """
 Transcription Service — OpenAI Whisper via API
-Downloads media temporarily, transcribes, cleans up
+Downloads media temporarily, transcribes, cleans up.
+Transcripts are cached (see transcript_cache.py) so repeat analyses skip both steps.
+Audio over the Whisper upload limit is split into overlapping ffmpeg chunks
+that are transcribed concurrently and stitched back together in order.
+TRANSCRIPTION_PIPELINE=memory streams yt-dlp → ffmpeg → an in-memory buffer
+instead (no temp files; the size cap is enforced while downloading).
 """
 import os
+import re
 import asyncio
 import tempfile
 import logging
 from pathlib import Path
 from openai import AsyncOpenAI
 
+from services.download_pool import DownloadWorkerPool
+from services.transcript_cache import TranscriptCache, TRANSCRIPT_CACHE_AUDIO_HASH, audio_fingerprint
+
 logger = logging.getLogger(__name__)
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 MAX_FILE_SIZE_MB = 25  # Whisper API limit
 
+# Chunking mode: long audio is split instead of skipped ("false" restores the skip)
+TRANSCRIPTION_CHUNKING = os.getenv("TRANSCRIPTION_CHUNKING", "true").lower() == "true"
+TRANSCRIPTION_MAX_DOWNLOAD_MB = int(os.getenv("TRANSCRIPTION_MAX_DOWNLOAD_MB", "200"))
+# ~10 MB per chunk at the --audio-quality 5 bitrate, well under the upload limit
+TRANSCRIPTION_CHUNK_SECONDS = float(os.getenv("TRANSCRIPTION_CHUNK_SECONDS", "600"))
+TRANSCRIPTION_CHUNK_OVERLAP_SECONDS = float(os.getenv("TRANSCRIPTION_CHUNK_OVERLAP_SECONDS", "3"))
+TRANSCRIPTION_CHUNK_CONCURRENCY = max(1, int(os.getenv("TRANSCRIPTION_CHUNK_CONCURRENCY", "4")))
+# "file": yt-dlp writes an MP3 to a temp dir. "memory": piped straight into RAM.
+TRANSCRIPTION_PIPELINE = os.getenv("TRANSCRIPTION_PIPELINE", "file")
+DOWNLOAD_TIMEOUT_SECONDS = 60
+# "pool": warm yt-dlp worker processes (download_pool.py). "subprocess": one yt-dlp CLI run per download.
+DOWNLOAD_BACKEND = os.getenv("DOWNLOAD_BACKEND", "pool")
+
+_PIPE_READ_SIZE = 1 << 16
+# Memory pipeline bitrate. Constant, because an MP3 written to a pipe has no
+# Xing/VBRI header and ffprobe estimates its duration from the first frame.
+_MEMORY_PIPELINE_BITRATE = "64k"
+# Less than this is an empty cut (ID3 header only) or a sliver Whisper rejects
+_MIN_CHUNK_BYTES = 4096
+_MIN_CHUNK_SECONDS = 30  # oversized chunks are halved down to this
+_CHUNK_ATTEMPTS = 2
+
+_STITCH_WINDOW_WORDS = 40  # longest overlap looked for between neighbouring chunks
+_WORD_RE = re.compile(r"[^\w']+")
+
+
+def _stitch(parts: list[str]) -> str:
+    """
+    Join chunk transcripts in order, dropping the words each chunk repeats from
+    the end of the previous one (the overlap region is transcribed twice).
+    """
+    words: list[str] = []
+    for part in parts:
+        incoming = part.split()
+        if words and incoming:
+            tail = [_WORD_RE.sub("", w).lower() for w in words[-_STITCH_WINDOW_WORDS:]]
+            head = [_WORD_RE.sub("", w).lower() for w in incoming[:_STITCH_WINDOW_WORDS]]
+            for size in range(min(len(tail), len(head)), 0, -1):
+                if tail[-size:] == head[:size]:
+                    incoming = incoming[size:]
+                    break
+        words.extend(incoming)
+    return " ".join(words)
+
 
 class TranscriptionService:
-    def __init__(self):
+    def __init__(self, cache: TranscriptCache | None = None):
         self._client: AsyncOpenAI | None = None
+        self.cache = cache or TranscriptCache()
+        self._download_pool: DownloadWorkerPool | None = None
 
     @property
     def client(self) -> AsyncOpenAI:
@@ -25,6 +80,11 @@ class TranscriptionService:
             self._client = AsyncOpenAI(api_key=OPENAI_API_KEY)
         return self._client
 
+    def close(self):
+        self.cache.close()
+        if self._download_pool:
+            self._download_pool.close()
+
     async def transcribe(self, media_url: str, language: str = "en") -> str:
         """
         Download media from URL and transcribe using Whisper.
@@ -33,43 +93,223 @@ class TranscriptionService:
         if not media_url or not OPENAI_API_KEY:
             return ""
 
+        cache_key = self.cache.key(media_url, language)
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Download with yt-dlp (handles TikTok, Instagram, YouTube, Facebook)
+        max_download_mb = TRANSCRIPTION_MAX_DOWNLOAD_MB if TRANSCRIPTION_CHUNKING else MAX_FILE_SIZE_MB
+        if TRANSCRIPTION_PIPELINE == "memory":
+            audio = await self._download_audio_to_memory(media_url, max_download_mb)
+            if audio is None:
+                return ""
+            return await self._transcribe_audio(audio, len(audio), cache_key, language)
+
         with tempfile.TemporaryDirectory() as tmpdir:
             output_path = Path(tmpdir) / "audio.mp3"
-
-            # Download with yt-dlp (handles TikTok, Instagram, YouTube, Facebook)
-            success = await self._download_audio(media_url, str(output_path))
+            success = await self._download_audio(media_url, str(output_path), max_download_mb)
             if not success:
                 return ""
+            return await self._transcribe_audio(
+                output_path, output_path.stat().st_size, cache_key, language,
+            )
+
+    async def _transcribe_audio(self, audio: Path | bytes, size: int, cache_key: str, language: str) -> str:
+        """Transcribe downloaded audio (a file or an in-memory MP3) and cache the result."""
+        # Check file size
+        file_size = size / (1024 * 1024)
+        if file_size > MAX_FILE_SIZE_MB and not TRANSCRIPTION_CHUNKING:
+            logger.warning(f"Audio file too large: {file_size:.1f}MB, skipping")
+            return ""
 
-            # Check file size
-            file_size = output_path.stat().st_size / (1024 * 1024)
+        # Same audio already transcribed under another URL (re-upload)?
+        audio_hash = None
+        if TRANSCRIPT_CACHE_AUDIO_HASH:
+            audio_hash = f"{language}:{await asyncio.to_thread(audio_fingerprint, audio)}"
+            cached = await self.cache.get_by_audio(audio_hash)
+            if cached is not None:
+                await self.cache.put(cache_key, cached, audio_hash)
+                return cached
+
+        # Transcribe
+        complete = True
+        try:
             if file_size > MAX_FILE_SIZE_MB:
-                logger.warning(f"Audio file too large: {file_size:.1f}MB, skipping")
-                return ""
+                transcript, complete = await self._transcribe_chunked(audio, language)
+            else:
+                transcript = await self._whisper(audio, language)
+        except Exception as e:
+            logger.error(f"Whisper transcription failed: {e}")
+            return ""
+
+        # Only complete Whisper results are cached — failures may be transient
+        if complete:
+            await self.cache.put(cache_key, transcript, audio_hash)
+        return transcript
+
+    async def _whisper(self, audio: Path | bytes, language: str) -> str:
+        if isinstance(audio, bytes):
+            return await self._whisper_upload(("audio.mp3", audio), language)
+        with open(audio, "rb") as audio_file:
+            return await self._whisper_upload(audio_file, language)
+
+    async def _whisper_upload(self, file, language: str) -> str:
+        response = await self.client.audio.transcriptions.create(
+            model="whisper-1",
+            file=file,
+            language=language,
+            response_format="text",
+        )
+        return str(response).strip()
+
+    async def _transcribe_chunked(self, audio: Path | bytes, language: str) -> tuple[str, bool]:
+        """
+        Split audio into TRANSCRIPTION_CHUNK_SECONDS segments, each running
+        TRANSCRIPTION_CHUNK_OVERLAP_SECONDS into the next so no word is cut in
+        half, and transcribe them concurrently. Returns (transcript, complete).
+        Empty cuts (past the real end of the audio) are skipped; a cut over the
+        upload limit is halved; a chunk Whisper still fails on after a retry is
+        left out, and the transcript is returned as incomplete. Raises only if
+        no chunk could be transcribed.
+        """
+        duration = await _audio_duration(audio)
+        starts = []
+        start = 0.0
+        while start < duration:
+            starts.append(start)
+            start += TRANSCRIPTION_CHUNK_SECONDS
+        logger.info(f"Transcribing {duration:.0f}s of audio in {len(starts)} chunks")
+
+        slots = asyncio.Semaphore(TRANSCRIPTION_CHUNK_CONCURRENCY)
+
+        async def transcribe_chunk(index: int, start: float) -> list[str | None]:
+            # The last chunk runs to the end: a duration estimated from the
+            # bitrate may fall short of the real length
+            length = (
+                TRANSCRIPTION_CHUNK_SECONDS + TRANSCRIPTION_CHUNK_OVERLAP_SECONDS
+                if index < len(starts) - 1 else None
+            )
+            async with slots:
+                return await self._transcribe_span(audio, start, length, language)
 
-            # Transcribe
+        spans = await asyncio.gather(*(transcribe_chunk(i, s) for i, s in enumerate(starts)))
+        parts = [part for span in spans for part in span]
+        transcribed = [part for part in parts if part is not None]
+        if not transcribed:
+            raise RuntimeError(f"none of {len(parts)} chunks could be transcribed")
+        if len(transcribed) < len(parts):
+            logger.warning(f"{len(parts) - len(transcribed)} of {len(parts)} chunks failed, transcript has gaps")
+        return _stitch(transcribed), len(transcribed) == len(parts)
+
+    async def _transcribe_span(
+        self, audio: Path | bytes, start: float, length: float | None, language: str,
+    ) -> list[str | None]:
+        """Transcripts of [start, start + length) in order; None marks a part that failed."""
+        chunk = await _cut_audio(audio, start, length)
+        if len(chunk) < _MIN_CHUNK_BYTES:
+            return []
+        if len(chunk) > MAX_FILE_SIZE_MB * 1024 * 1024:
+            half = (length or TRANSCRIPTION_CHUNK_SECONDS) / 2
+            if half < _MIN_CHUNK_SECONDS:
+                logger.warning(f"Chunk at {start:.0f}s still over {MAX_FILE_SIZE_MB}MB, skipping")
+                return [None]
+            first = await self._transcribe_span(audio, start, half + TRANSCRIPTION_CHUNK_OVERLAP_SECONDS, language)
+            rest = await self._transcribe_span(
+                audio, start + half, None if length is None else length - half, language,
+            )
+            return first + rest
+        for attempt in range(1, _CHUNK_ATTEMPTS + 1):
             try:
-                with open(output_path, "rb") as audio_file:
-                    response = await self.client.audio.transcriptions.create(
-                        model="whisper-1",
-                        file=audio_file,
-                        language=language,
-                        response_format="text",
-                    )
-                return str(response).strip()
+                return [await self._whisper(chunk, language)]
             except Exception as e:
-                logger.error(f"Whisper transcription failed: {e}")
-                return ""
+                logger.warning(f"Chunk at {start:.0f}s failed (attempt {attempt}): {e}")
+        return [None]
+
+    async def _download_audio_to_memory(self, url: str, max_size_mb: int = MAX_FILE_SIZE_MB) -> bytes | None:
+        """
+        yt-dlp (best audio stream, to stdout) piped into ffmpeg (→ MP3 on
+        stdout), read into memory. Both processes are killed as soon as the
+        MP3 passes max_size_mb or the download passes its timeout.
+        """
+        max_bytes = max_size_mb * 1024 * 1024
+        read_fd, write_fd = os.pipe()
+        procs: list[asyncio.subprocess.Process] = []
+        try:
+            try:
+                procs.append(await asyncio.create_subprocess_exec(
+                    "yt-dlp", "--format", "bestaudio/best", "--max-filesize", f"{max_size_mb}m",
+                    "--no-playlist", "--quiet", "-o", "-", url,
+                    stdout=write_fd, stderr=asyncio.subprocess.PIPE,
+                ))
+                procs.append(await asyncio.create_subprocess_exec(
+                    "ffmpeg", "-v", "error", "-i", "pipe:0", "-vn",
+                    "-codec:a", "libmp3lame", "-b:a", _MEMORY_PIPELINE_BITRATE, "-f", "mp3", "pipe:1",
+                    stdin=read_fd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+                ))
+            finally:
+                # The children hold their own copies of the pipe ends
+                os.close(read_fd)
+                os.close(write_fd)
+            ytdlp, ffmpeg = procs
+
+            async def read_audio() -> bytearray | None:
+                audio = bytearray()
+                while chunk := await ffmpeg.stdout.read(_PIPE_READ_SIZE):
+                    audio += chunk
+                    if len(audio) > max_bytes:
+                        # Stop the download now, not when yt-dlp gets to the end
+                        for proc in procs:
+                            proc.kill()
+                        return None
+                return audio
+
+            audio, ytdlp_err, ffmpeg_err = await asyncio.wait_for(
+                asyncio.gather(read_audio(), ytdlp.stderr.read(), ffmpeg.stderr.read()),
+                timeout=DOWNLOAD_TIMEOUT_SECONDS,
+            )
+            if audio is None:
+                logger.warning(f"Audio stream over {max_size_mb}MB, skipping")
+                return None
+            if await ytdlp.wait() != 0 or await ffmpeg.wait() != 0 or not audio:
+                logger.debug(f"yt-dlp/ffmpeg pipe failed: {(ytdlp_err or ffmpeg_err).decode()[:200]}")
+                return None
+            return bytes(audio)
+        except asyncio.TimeoutError:
+            logger.warning("yt-dlp download timed out")
+            return None
+        except Exception as e:
+            logger.error(f"Download error: {e}")
+            return None
+        finally:
+            for proc in procs:
+                if proc.returncode is None:
+                    proc.kill()
+                    await proc.wait()
 
-    async def _download_audio(self, url: str, output_path: str) -> bool:
+    async def _download_audio(self, url: str, output_path: str, max_size_mb: int = MAX_FILE_SIZE_MB) -> bool:
         """Download audio from media URL using yt-dlp."""
+        if DOWNLOAD_BACKEND == "pool":
+            if self._download_pool is None:
+                self._download_pool = DownloadWorkerPool()
+            try:
+                return await self._download_pool.download(
+                    url, output_path, max_size_mb, timeout=DOWNLOAD_TIMEOUT_SECONDS,
+                )
+            except asyncio.TimeoutError:
+                logger.warning("yt-dlp download timed out")
+                return False
+            except Exception as e:
+                logger.error(f"Download error: {e}")
+                return False
+
         try:
             cmd = [
                 "yt-dlp",
                 "--extract-audio",
                 "--audio-format", "mp3",
                 "--audio-quality", "5",          # lower quality = smaller file
-                "--max-filesize", "25m",
+                "--max-filesize", f"{max_size_mb}m",
                 "--no-playlist",
                 "--quiet",
                 "-o", output_path,
@@ -80,7 +320,7 @@ class TranscriptionService:
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
-            _, stderr = await asyncio.wait_for(proc.communicate(), timeout=60)
+            _, stderr = await asyncio.wait_for(proc.communicate(), timeout=DOWNLOAD_TIMEOUT_SECONDS)
 
             if proc.returncode != 0:
                 logger.debug(f"yt-dlp failed: {stderr.decode()[:200]}")
@@ -93,3 +333,45 @@ class TranscriptionService:
         except Exception as e:
             logger.error(f"Download error: {e}")
             return False
+
+
+async def _run_ffmpeg_tool(*cmd: str, input: bytes | None = None) -> bytes:
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE if input is not None else asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(input), timeout=120)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise RuntimeError(f"{cmd[0]} timed out")
+    if proc.returncode != 0:
+        raise RuntimeError(f"{cmd[0]} failed: {stderr.decode()[:200]}")
+    return stdout
+
+
+def _ffmpeg_input(audio: Path | bytes) -> tuple[str, bytes | None]:
+    """(ffmpeg -i argument, bytes to pipe to stdin)"""
+    return ("pipe:0", audio) if isinstance(audio, bytes) else (str(audio), None)
+
+
+async def _audio_duration(audio: Path | bytes) -> float:
+    """Duration in seconds, via ffprobe."""
+    source, data = _ffmpeg_input(audio)
+    out = await _run_ffmpeg_tool(
+        "ffprobe", "-v", "error", "-show_entries", "format=duration",
+        "-of", "default=noprint_wrappers=1:nokey=1", source, input=data,
+    )
+    return float(out.decode().strip())
+
+
+async def _cut_audio(audio: Path | bytes, start: float, length: float | None) -> bytes:
+    """[start, start + length) of an MP3 (to the end if length is None), without re-encoding."""
+    source, data = _ffmpeg_input(audio)
+    duration = ["-t", f"{length:.3f}"] if length is not None else []
+    return await _run_ffmpeg_tool(
+        "ffmpeg", "-v", "error", "-ss", f"{start:.3f}", *duration,
+        "-i", source, "-c", "copy", "-f", "mp3", "pipe:1", input=data,
+    )
@@ -0,0 +1,115 @@
+"""
+BrowserPool against a local HTML fixture server (tests/fixtures/ over http.server).
+Skipped when Playwright or its Chromium build isn't installed
+(`playwright install chromium`).
+"""
+import time
+import asyncio
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("playwright.async_api")
+
+from scrapers.browser_pool import BrowserPool  # noqa: E402
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+FOLLOWERS_SELECTOR = "a[href$='/followers/']"
+
+
+class _FixtureHandler(SimpleHTTPRequestHandler):
+    """Serves tests/fixtures/; /slow/<file> answers after a delay. Tracks peak concurrency."""
+
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.peak = max(cls.peak, cls.in_flight)
+        try:
+            if self.path.startswith("/slow/"):
+                time.sleep(0.3)
+                self.path = self.path[len("/slow"):]
+            super().do_GET()
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def chromium():
+    from playwright.async_api import async_playwright
+
+    async def launch():
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=True)
+            await browser.close()
+
+    try:
+        asyncio.run(launch())
+    except Exception as e:
+        pytest.skip(f"Chromium unavailable: {str(e).splitlines()[0]}")
+
+
+@pytest.fixture
+def base_url(chromium):
+    _FixtureHandler.in_flight = _FixtureHandler.peak = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(_FixtureHandler, directory=str(FIXTURES)))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _with_pool(size: int, max_uses: int, work):
+    async def run():
+        pool = BrowserPool(size=size, max_uses=max_uses)
+        try:
+            return await work(pool), dict(pool.stats)
+        finally:
+            await pool.close()
+
+    return asyncio.run(run())
+
+
+def test_render_returns_fixture_content(base_url):
+    async def work(pool):
+        return await pool.render(f"{base_url}/instagram_profile.html", wait_for=FOLLOWERS_SELECTOR)
+
+    (html, text), stats = _with_pool(1, 20, work)
+    assert "Fixture Creator (@fixture)" in html
+    assert "12.3K followers" in text
+    assert stats["renders"] == 1
+
+
+def test_contexts_reused_then_recycled(base_url):
+    async def work(pool):
+        for _ in range(7):
+            await pool.render(f"{base_url}/instagram_profile.html", wait_for=FOLLOWERS_SELECTOR)
+
+    _, stats = _with_pool(1, 3, work)
+    # One browser; contexts serve 3 + 3 + 1 pages, the first two recycled after their third
+    assert stats == {"launches": 1, "contexts_created": 3, "contexts_recycled": 2, "renders": 7}
+
+
+def test_concurrent_renders_capped_at_pool_size(base_url):
+    async def work(pool):
+        return await asyncio.gather(*(
+            pool.render(f"{base_url}/slow/instagram_profile.html") for _ in range(6)
+        ))
+
+    results, stats = _with_pool(2, 20, work)
+    assert all("12.3K followers" in text for _, text in results)
+    assert _FixtureHandler.peak == 2
+    assert stats["launches"] == 1
+    assert stats["contexts_created"] == 2
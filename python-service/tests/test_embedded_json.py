@@ -0,0 +1,92 @@
+"""
+extract_embedded_json — marker search, full decode and the path-pruned scanner.
+"""
+import json
+
+import pytest
+
+from scrapers.embedded_json import extract_embedded_json
+
+MARKERS = ("var ytInitialData",)
+
+DOC = {
+    "responseContext": {"tracking": [{"key": "a", "value": "x"}] * 3},
+    "tricky": {
+        "quotes": "she said \"}{][\" and left",
+        "backslash": "C:\\path\\",
+        "brackets": ["[", "]", "{", "}", "{\"a\": [1, 2]}"],
+        "unicode": "caf\u00e9 \u2603 \U0001f600",  # the emoji dumps as a surrogate pair
+        "escaped \"key\"": {"nested": True},
+    },
+    "contents": {"tabs": [{"title": "Videos", "items": [1, 2.5, -3e2, None, False]}], "other": {"n": 1}},
+    "header": {"title": "Fixture } ] Channel", "badges": []},
+    "tail": ["x" * 100] * 10,
+}
+
+
+def _page(data, **dumps) -> str:
+    return f"<script>var ytInitialData = {json.dumps(data, **dumps)};</script><footer></footer>"
+
+
+@pytest.mark.parametrize("dumps", [{}, {"ensure_ascii": False}, {"indent": 2}, {"separators": (",", ":")}])
+def test_full_decode(dumps):
+    assert extract_embedded_json(_page(DOC, **dumps), MARKERS) == DOC
+
+
+@pytest.mark.parametrize("dumps", [{}, {"ensure_ascii": False}, {"indent": 2}, {"separators": (",", ":")}])
+def test_paths_across_escapes_and_brackets_in_strings(dumps):
+    # Every key before "header" holds strings with quotes, backslashes and brackets the scanner must skip
+    result = extract_embedded_json(_page(DOC, **dumps), MARKERS, paths=[("header",), ("contents", "tabs")])
+    assert result == {"header": DOC["header"], "contents": {"tabs": DOC["contents"]["tabs"]}}
+
+
+def test_escaped_keys_match():
+    result = extract_embedded_json(_page(DOC), MARKERS, paths=[("tricky", 'escaped "key"', "nested")])
+    assert result == {"tricky": {'escaped "key"': {"nested": True}}}
+
+
+def test_missing_paths_are_absent():
+    result = extract_embedded_json(
+        _page(DOC), MARKERS, paths=[("header",), ("nope",), ("contents", "nope"), ("header", "title", "deeper")],
+    )
+    # ("header", "title", "deeper") is inside ("header",), which covers it
+    assert result == {"header": DOC["header"], "contents": {}}
+
+
+def test_path_through_non_object_is_skipped():
+    assert extract_embedded_json(_page(DOC), MARKERS, paths=[("tail", "0")]) == {}
+
+
+@pytest.mark.parametrize("paths", [
+    [("b",), ("b", "b", "a")],
+    [("b", "b", "a"), ("b",)],
+    [("b", "b"), ("b", "b", "a"), ("b",)],
+    [("b",), ("b",)],
+])
+def test_overlapping_paths_merge_shorter_wins(paths):
+    data = {"a": 1, "b": {"b": {"a": 2, "c": 3}, "d": 4}, "e": 5}
+    assert extract_embedded_json(_page(data), MARKERS, paths=paths) == {"b": data["b"]}
+
+
+def test_empty_path_rejected():
+    with pytest.raises(ValueError):
+        extract_embedded_json(_page(DOC), MARKERS, paths=[()])
+
+
+@pytest.mark.parametrize("paths", [None, [("header",)], [("tail",)]])
+def test_truncated_input_returns_none(paths):
+    blob = json.dumps(DOC)
+    # Cut everywhere interesting: inside strings, escapes, numbers, between tokens
+    for cut in range(len(blob) - 1, 0, -7):
+        html = "var ytInitialData = " + blob[:cut]
+        result = extract_embedded_json(html, MARKERS, paths=paths)
+        if paths is None:
+            assert result is None, cut
+        else:
+            # A subtree complete before the cut is returned (the scan stops there); otherwise None
+            assert result in (None, {paths[0][0]: DOC[paths[0][0]]}), cut
+
+
+def test_no_marker():
+    assert extract_embedded_json("<html>nothing here</html>", MARKERS) is None
+    assert extract_embedded_json("var ytInitialData = 'not an object'", MARKERS) is None
@@ -0,0 +1,40 @@
+"""
+int8 vs float32 keyword parity on the real all-MiniLM-L6-v2 weights.
+Skipped when torch/sentence-transformers or the weights aren't available
+(no network, no local Hugging Face cache). Threshold: KEYWORD_PARITY_MIN_OVERLAP.
+"""
+import os
+import statistics
+
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("keybert")
+pytest.importorskip("sentence_transformers")
+
+from analyzers.content import load_keyword_model  # noqa: E402
+from scripts.benchmark_keywords import SAMPLE_DOCS  # noqa: E402
+from scripts.keyword_parity import compare_precisions  # noqa: E402
+
+MIN_OVERLAP = float(os.getenv("KEYWORD_PARITY_MIN_OVERLAP", "0.8"))
+
+
+@pytest.fixture(scope="module")
+def report():
+    try:
+        load_keyword_model("float32")
+    except Exception as e:
+        pytest.skip(f"all-MiniLM-L6-v2 weights unavailable: {e}")
+    return compare_precisions(SAMPLE_DOCS)
+
+
+def test_int8_keywords_match_float32(report):
+    assert statistics.mean(report["overlaps"]) >= MIN_OVERLAP
+
+
+def test_int8_embeddings_close_to_float32(report):
+    assert report["cosine"].min() >= 0.95
+
+
+def test_int8_model_smaller(report):
+    assert report["model_mb"]["int8"] < report["model_mb"]["float32"] * 0.75
@@ -0,0 +1,45 @@
+"""
+analyzers/keywords.py selection against KeyBERT's own mmr / max_sum_distance,
+on random embeddings (no model weights needed). Skipped without keybert.
+"""
+import os
+
+import numpy as np
+import pytest
+
+pytest.importorskip("keybert")
+
+from keybert._maxsum import max_sum_distance  # noqa: E402
+from keybert._mmr import mmr  # noqa: E402
+
+from analyzers.keywords import KEYWORD_DIVERSITY, KEYWORD_MMR_DIVERSITY, select_keywords  # noqa: E402
+
+
+def _document(seed: int, n_candidates: int):
+    rng = np.random.default_rng(seed)
+    vectors = rng.normal(size=(n_candidates + 1, 32)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors[0], vectors[1:], [f"word{i}" for i in range(n_candidates)]
+
+
+@pytest.mark.parametrize("n_candidates", [5, 12, 20, 45, 90])
+def test_mmr_matches_keybert(n_candidates):
+    for seed in range(20):
+        doc, candidates, words = _document(seed, n_candidates)
+        expected = mmr(doc.reshape(1, -1), candidates, words, 10, KEYWORD_MMR_DIVERSITY)
+        ours = select_keywords(doc, candidates, words, 10, diversity="mmr")
+        assert set(ours) == {word for word, _ in expected}
+
+
+@pytest.mark.parametrize("n_candidates", [12, 20, 30])
+def test_maxsum_matches_keybert(n_candidates):
+    for seed in range(5):
+        doc, candidates, words = _document(seed, n_candidates)
+        expected = max_sum_distance(doc.reshape(1, -1), candidates, words, 5, 12)
+        ours = select_keywords(doc, candidates, words, 5, nr_candidates=12, diversity="maxsum")
+        assert set(ours) == {word for word, _ in expected}
+
+
+@pytest.mark.skipif("KEYWORD_DIVERSITY" in os.environ, reason="KEYWORD_DIVERSITY overridden")
+def test_default_is_mmr():
+    assert KEYWORD_DIVERSITY == "mmr"
@@ -0,0 +1,126 @@
+"""
+RuleEngine parity: hook type, hook score and CTA detection must stay exactly
+what the original per-pattern re.search loops produced. The reference below
+is that original code, fed the same HOOK_PATTERNS / CTA_PHRASES, so an edit
+to either list is checked against the old matching semantics.
+"""
+import re
+import random
+
+import pytest
+
+from analyzers.content import CTA_PHRASES, HOOK_PATTERNS, POWER_WORDS, WEAK_STARTERS, ContentAnalyzer
+
+_HOOK_TYPE_SCORES = {"question": 0.7, "stat": 0.8, "controversial": 0.85, "story": 0.65, "statement": 0.7}
+_CTA_PATTERN = r"\b(" + "|".join(re.escape(phrase) for phrase in CTA_PHRASES) + r")\b"
+
+
+def _reference_hook(text: str) -> tuple[str, float]:
+    sentences = re.split(r'(?<=[.!?])\s+', text.strip())
+    hook_text = sentences[0][:200] if sentences else text[:200]
+    hook_lower = hook_text.lower().strip()
+    detected_type = "none"
+    base_score = 0.2
+    for hook_type, patterns in HOOK_PATTERNS.items():
+        for pattern in patterns:
+            if re.search(pattern, hook_lower, re.IGNORECASE):
+                detected_type = hook_type
+                base_score = _HOOK_TYPE_SCORES.get(hook_type, 0.5)
+                break
+        if detected_type != "none":
+            break
+    score = min(1.0, base_score + sum(1 for w in POWER_WORDS if w in hook_lower) * 0.05)
+    for weak in WEAK_STARTERS:
+        if hook_lower.startswith(weak):
+            score = max(0.1, score - 0.2)
+            break
+    return detected_type, round(score, 3)
+
+
+def _reference_cta(text: str) -> bool:
+    return bool(re.search(_CTA_PATTERN, text.lower(), re.IGNORECASE))
+
+
+CORPUS = [
+    "",
+    "How I grew to 100k followers",
+    "Is this the best budget camera?",
+    "50% of creators quit in year one?",          # stat opening ending in "?": question's "?$" comes first
+    "10 tips for better reels?",
+    "$5 dinners? Here's how",
+    "In 30 days I lost 5kg. Follow for more",
+    "Unpopular opinion: hashtags are dead?",
+    "I was wrong about morning routines",
+    "Story time: the day I got banned",
+    "Here's why your reels flop",
+    "the #1 mistake new creators make",
+    "Hey guys, welcome back?",
+    "hi everyone, today I'm showing my secret proven setup",
+    "In this video I explain everything. Link in bio!",
+    "Turn on notifications so you never miss a drop",
+    "turn off the lights and watch",
+    "Turn o the lights",                            # prefix of turn on/off only
+    "return on investment explained",               # "turn on" inside a word
+    "ugh, turnoff",
+    "don't forget to like and subscribe",
+    "she likes it",                                 # "like" inside a word
+    "DM me for the link",
+    "Check out my other video. Drop a comment!",
+    "nothing to see here",
+    "WHY does nobody talk about this",
+    "this changed everything. seriously",
+    "Shocking! Warning: incredible, life-changing, exposed and banned",
+    "Most people never finally do it",
+    "what?",
+    "  ?  ",
+    "İstanbul in 3 days",
+    "Straße food tour. hit follow",
+]
+
+
+def _random_corpus(n: int) -> list[str]:
+    pieces = [
+        "what", "how", "why", "did you", "is this", "i was", "i used to", "when i", "last week", "true story",
+        "one day", "unpopular opinion", "hot take", "stop doing", "the #1", "here's why", "most people",
+        "12%", "5$", "in 3", "10 ways", "3 mistakes", "secret", "never", "life-changing", "hi ", "hey ",
+        "welcome", "today i", "in this video", "follow", "subscribe", "likes", "dm", "dms", "link in bio",
+        "check out", "let me know", "drop a", "hit the", "turn on", "turn off", "turn o", "hit follow",
+        "?", ".", "!", "\n", "Follow", "SUBSCRIBE", "tagged", "foll", "ow", "the",
+    ]
+    rng = random.Random(4)
+    return [
+        "".join(rng.choice(pieces) + rng.choice(["", " ", "? ", ". ", ", "]) for _ in range(rng.randint(1, 7)))
+        for _ in range(n)
+    ]
+
+
+@pytest.fixture(scope="module")
+def analyzer():
+    # Rules only: skip __init__ (embedding cache, batcher)
+    return ContentAnalyzer.__new__(ContentAnalyzer)
+
+
+@pytest.mark.parametrize("text", CORPUS)
+def test_hook_matches_reference(analyzer, text):
+    result = analyzer.analyze_hook(text)
+    if not text.strip():
+        assert result["hook_type"] == "none" and result["score"] == 0.0
+        return
+    assert (result["hook_type"], result["score"]) == _reference_hook(text)
+
+
+@pytest.mark.parametrize("text", CORPUS)
+def test_cta_matches_reference(analyzer, text):
+    assert analyzer.detect_cta(text) == (bool(text) and _reference_cta(text))
+
+
+def test_random_corpus_matches_reference(analyzer):
+    for text in _random_corpus(5000):
+        if text.strip():
+            result = analyzer.analyze_hook(text)
+            assert (result["hook_type"], result["score"]) == _reference_hook(text), text
+        assert analyzer.detect_cta(text) == _reference_cta(text), text
+
+
+def test_corpus_covers_every_hook_type():
+    assert {_reference_hook(text)[0] for text in CORPUS if text.strip()} >= set(HOOK_PATTERNS) | {"none"}
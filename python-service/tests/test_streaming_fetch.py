@@ -0,0 +1,92 @@
+"""
+ScriptBlockMatcher / fetch_text: a streamed prefix must decode to the same
+blob as the full page.
+"""
+import json
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from scrapers.embedded_json import (  # noqa: E402
+    extract_embedded_json, TIKTOK_SIGI_MARKERS, TIKTOK_UNIVERSAL_MARKERS, YOUTUBE_INITIAL_DATA_MARKERS,
+)
+from scrapers.streaming_fetch import ScriptBlockMatcher, fetch_text  # noqa: E402
+
+REAL = {"header": {"title": "Real Channel"}, "note": "</ escaped as <\\/ in pages"}
+STUB = {"header": {"title": "Stub"}}
+
+
+def _script(prefix: str, data: dict) -> str:
+    blob = json.dumps(data).replace("</", "<\\/")
+    return f"<script>{prefix}{blob};</script>"
+
+
+def _page(*scripts: str) -> str:
+    return "<html><head><title>t</title></head><body>" + "".join(scripts) + "<footer>" + "x" * 5000 + "</footer></body></html>"
+
+
+def _stream(page: str, matcher: ScriptBlockMatcher, chunk: int) -> str:
+    """The prefix fetch_text would keep: everything up to the chunk that completes the matcher."""
+    for end in range(chunk, len(page) + chunk, chunk):
+        if matcher.feed(page[end - chunk:end]):
+            return page[:end]
+    return page
+
+
+@pytest.mark.parametrize("chunk", [1, 7, 64, 4096])
+def test_fallback_marker_before_primary_decodes_like_full_page(chunk):
+    page = _page(
+        _script('window["ytInitialData"] = ', STUB),
+        _script("var ytInitialData = ", REAL),
+    )
+    prefix = _stream(page, ScriptBlockMatcher(YOUTUBE_INITIAL_DATA_MARKERS), chunk)
+    assert len(prefix) < len(page)
+    full = extract_embedded_json(page, YOUTUBE_INITIAL_DATA_MARKERS)
+    assert full == REAL
+    assert extract_embedded_json(prefix, YOUTUBE_INITIAL_DATA_MARKERS) == full
+
+
+@pytest.mark.parametrize("chunk", [1, 64])
+def test_fallback_marker_alone_reads_whole_page(chunk):
+    page = _page(_script('window["ytInitialData"] = ', REAL))
+    prefix = _stream(page, ScriptBlockMatcher(YOUTUBE_INITIAL_DATA_MARKERS), chunk)
+    assert prefix == page
+    assert extract_embedded_json(prefix, YOUTUBE_INITIAL_DATA_MARKERS) == REAL
+
+
+@pytest.mark.parametrize("chunk", [1, 64])
+def test_marker_without_brace_is_skipped(chunk):
+    page = _page(
+        "<p>var ytInitialData" + " " * 200 + "</p>",
+        _script("var ytInitialData = ", REAL),
+    )
+    prefix = _stream(page, ScriptBlockMatcher(YOUTUBE_INITIAL_DATA_MARKERS), chunk)
+    assert len(prefix) < len(page)
+    assert extract_embedded_json(prefix, YOUTUBE_INITIAL_DATA_MARKERS) == REAL
+
+
+@pytest.mark.parametrize("first", [TIKTOK_UNIVERSAL_MARKERS, TIKTOK_SIGI_MARKERS])
+def test_any_marker_set_completes(first):
+    page = _page(f'<script {first[0]} type="application/json">{json.dumps(REAL)}</script>')
+    prefix = _stream(page, ScriptBlockMatcher(TIKTOK_UNIVERSAL_MARKERS, TIKTOK_SIGI_MARKERS), 64)
+    assert len(prefix) < len(page)
+    assert extract_embedded_json(prefix, first) == REAL
+
+
+def test_fetch_text_stops_after_block():
+    page = _page(_script("var ytInitialData = ", REAL)).encode()
+
+    async def body():
+        for i in range(0, len(page), 256):
+            yield page[i:i + 256]
+
+    async def run():
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body()))
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await fetch_text(client, "https://example.com/", ScriptBlockMatcher(YOUTUBE_INITIAL_DATA_MARKERS))
+
+    _, text, outcome = asyncio.run(run())
+    assert outcome == "matched"
+    assert extract_embedded_json(text, YOUTUBE_INITIAL_DATA_MARKERS) == REAL
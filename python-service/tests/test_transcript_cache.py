@@ -0,0 +1,46 @@
+"""
+normalize_media_url — transcript cache keys.
+"""
+import pytest
+
+from services.transcript_cache import normalize_media_url
+
+
+@pytest.mark.parametrize("a, b", [
+    ("https://youtu.be/abc123?t=30", "https://www.youtube.com/watch?v=abc123&t=30"),
+    ("https://youtu.be/abc123?si=xyz", "https://m.youtube.com/watch?v=abc123"),
+    ("https://www.youtube.com/shorts/abc123/", "https://youtube.com/watch?feature=share&v=abc123"),
+    ("https://www.youtube.com/watch?v=abc123&list=PL1&index=4", "https://youtube.com/watch?v=abc123"),
+    (
+        "https://scontent.cdninstagram.com/v/t50/clip.mp4?_nc_ht=a&oh=1&oe=2",
+        "https://scontent.cdninstagram.com/v/t50/clip.mp4?oh=3&oe=4",
+    ),
+    (
+        "https://rr3---sn-abc.googlevideo.com/videoplayback?id=o-AAA&itag=140&expire=1&sig=x",
+        "https://rr3---sn-abc.googlevideo.com/videoplayback?expire=2&itag=140&sig=y&id=o-AAA",
+    ),
+    ("https://example.com/video/1?utm_source=x&b=2&a=1#frag", "https://example.com/video/1?a=1&b=2"),
+])
+def test_same_media_same_key(a, b):
+    assert normalize_media_url(a) == normalize_media_url(b)
+
+
+@pytest.mark.parametrize("a, b", [
+    ("https://youtu.be/abc123", "https://youtu.be/abc124"),
+    (
+        "https://rr3---sn-abc.googlevideo.com/videoplayback?id=o-AAA&itag=140",
+        "https://rr3---sn-abc.googlevideo.com/videoplayback?id=o-BBB&itag=140",
+    ),
+    (
+        "https://rr3---sn-abc.googlevideo.com/videoplayback?id=o-AAA&itag=140",
+        "https://rr3---sn-abc.googlevideo.com/videoplayback?id=o-AAA&itag=251",
+    ),
+    ("https://www.tiktok.com/@a/video/1", "https://www.tiktok.com/@a/video/2"),
+    ("https://example.com/watch?id=1", "https://example.com/watch?id=2"),
+])
+def test_different_media_different_key(a, b):
+    assert normalize_media_url(a) != normalize_media_url(b)
+
+
+def test_canonical_form():
+    assert normalize_media_url(" https://youtu.be/abc123?t=30 ") == "https://youtube.com/watch?v=abc123"